@@ -7,19 +7,15 @@ class LRUCache:
         self.capacity = capacity
 
     def get(self, key: int) -> int:
-        if key not in self.cache.keys():
+        value = self.cache.get(key)
+        if value is None:
             return -1
-        value = self.cache[key]
         self.cache.move_to_end(key)
         return value
 
     def put(self, key: int, value: int) -> None:
-
-        if key in self.cache.keys():
-            self.cache.move_to_end(key)
-        else:
-            if len(self.cache) >= self.capacity:
-                self.cache.popitem(last=False)
+        if self.cache.pop(key, None) is None and len(self.cache) >= self.capacity:
+            self.cache.popitem(last=False)
         self.cache[key] = value
 
 
@@ -1,4 +1,7 @@
-from collections import defaultdict
+import unicodedata
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
 
 def isAnagram(s: str, t: str) -> bool:
@@ -34,8 +37,120 @@ def isAnagram3(s: str, t: str) -> bool:
     return all(x == 0 for x in freq.values())
 
 
+def anagramSignature(word: str, casefold: bool = True) -> str:
+    """
+    Key shared by all anagrams of word: its characters in sorted order, which records how many times
+    each character occurs. Words are NFC-normalized first so that composed and decomposed accents
+    (é vs e + U+0301) match, and casefolded unless casefold is False.
+    """
+    word = unicodedata.normalize('NFC', word)
+    if casefold:
+        word = word.casefold()
+    return ''.join(sorted(word))
 
 
+def _signatures(words: list[str], casefold: bool) -> dict[str, list[str]]:
+    classes = {}
+    for word in words:
+        classes.setdefault(anagramSignature(word, casefold), []).append(word)
+    return classes
+
+
+class AnagramIndex:
+    """Groups words into anagram classes keyed on anagramSignature for constant-time lookups."""
+
+    def __init__(self, casefold: bool = True):
+        self.casefold = casefold
+        # signature -> words of the class (a dict used as an insertion-ordered set)
+        self.classes: dict[str, dict[str, None]] = {}
+
+    def add(self, word: str) -> None:
+        self.classes.setdefault(anagramSignature(word, self.casefold), {})[word] = None
+
+    def update(self, words) -> None:
+        self.merge(_signatures(words, self.casefold))
+
+    def merge(self, classes: dict[str, list[str]]) -> None:
+        for signature, words in classes.items():
+            self.classes.setdefault(signature, {}).update(dict.fromkeys(words))
+
+    @classmethod
+    def from_file(cls, path: str, casefold: bool = True, workers: int | None = None,
+                  chunk_size: int = 100_000, encoding: str = 'utf-8') -> 'AnagramIndex':
+        """
+        Build an index from a file with one word per line, read in chunks of chunk_size lines.
+        With workers, signatures are computed in a process pool; at most two chunks per worker are in
+        flight, so memory stays bounded however large the file is.
+        """
+        index = cls(casefold)
+        with open(path, encoding=encoding) as f:
+            # Only an empty raw chunk ends the file; blank lines are dropped afterwards, so a chunk of blank
+            # lines does not stop the read
+            raw_chunks = iter(lambda: list(islice(f, chunk_size)), [])
+            chunks = ([word for word in (line.strip() for line in lines) if word] for lines in raw_chunks)
+            if not workers:
+                for words in chunks:
+                    index.update(words)
+                return index
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                in_flight = deque()
+                for words in chunks:
+                    in_flight.append(executor.submit(_signatures, words, casefold))
+                    if len(in_flight) >= 2 * workers:
+                        index.merge(in_flight.popleft().result())
+                while in_flight:
+                    index.merge(in_flight.popleft().result())
+        return index
+
+    def anagrams(self, word: str) -> list[str]:
+        """Other words of the index that are anagrams of word."""
+        words = self.classes.get(anagramSignature(word, self.casefold), {})
+        return [other for other in words if other != word]
+
+    def groups(self, min_size: int = 2):
+        """Yield every anagram class with at least min_size words."""
+        for words in self.classes.values():
+            if len(words) >= min_size:
+                yield list(words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.classes.get(anagramSignature(word, self.casefold), {})
+
+    def __len__(self) -> int:
+        return sum(len(words) for words in self.classes.values())
+
 
 if __name__ == '__main__':
     print(isAnagram3("ab_b", "b_ab"))
+
+    index = AnagramIndex()
+    index.update(["listen", "silent", "enlist", "Tinsel", "google", "café", "face\u0301", "éfac"])
+    print(index.anagrams("inlets"), index.anagrams("cafe\u0301"), list(index.groups()))
+
+    import os
+    import random
+    import string
+    import tempfile
+    import timeit
+
+    random.seed(0)
+    path = os.path.join(tempfile.gettempdir(), f'anagram-words-{os.getpid()}.txt')
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            for _ in range(1_000_000):
+                f.write(''.join(random.choices(string.ascii_lowercase[:8], k=random.randint(3, 7))) + '\n')
+
+        for workers in (None, os.cpu_count()):
+            elapsed = timeit.timeit(lambda: AnagramIndex.from_file(path, workers=workers), number=1)
+            print(f"build from 1M words, workers={workers}: {elapsed:.2f} s")
+
+        index = AnagramIndex.from_file(path)
+        with open(path, encoding='utf-8') as f:
+            words = [line.strip() for line in f][:100_000]
+        queries = words[:100]
+        scan = timeit.timeit(lambda: [[w for w in words if isAnagram3(q, w)] for q in queries[:5]], number=1) / 5
+        lookup = timeit.timeit(lambda: [index.anagrams(q) for q in queries], number=1) / len(queries)
+        print(f"anagrams of X: scan of 100k words with isAnagram3 {scan * 1000:.0f} ms, index {lookup * 1e6:.1f} us")
+    finally:
+        os.remove(path)
@@ -0,0 +1,281 @@
+"""
+Incremental bracket validator for inputs too large to hold in memory.
+
+Unlike isValid / isValid2 (Valid-Parentheses.py), the input is consumed as a
+sequence of str or bytes chunks (or a memory-mapped file), the bracket pairs
+and quote characters are configurable, brackets inside quoted regions are
+ignored, and the first error is reported with its offset and line.
+A regular expression splits every chunk into brackets and whole quoted
+regions at C speed, so Python only looks at the brackets.
+"""
+
+import mmap
+import re
+from array import array
+from collections import namedtuple
+from itertools import accumulate
+
+# offset: 0-based position of the offending character (in characters for str chunks, bytes for bytes chunks)
+# line: 1-based line of that character
+BracketError = namedtuple('BracketError', ['offset', 'line', 'message'])
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class BracketValidator:
+    """
+    Feed chunks with feed(), then call close(); both return the first error, or None.
+
+    ``pairs`` concatenates the opening and closing character of every pair ("()[]{}" by default).
+    Between two identical ``quotes`` characters brackets are ignored, and ``escape`` makes the next
+    character of the quoted region literal. Pass quotes='' to disable quoted regions.
+    """
+
+    def __init__(self, pairs: str = '()[]{}', quotes: str = '"\'', escape: str | None = '\\'):
+        if len(pairs) % 2 or len(set(pairs)) != len(pairs):
+            raise ValueError("pairs must be distinct opening/closing characters, e.g. '()[]{}'")
+        if set(quotes) & set(pairs) or (escape is not None and (len(escape) != 1 or escape in pairs + quotes)):
+            raise ValueError("quotes and escape must be single characters distinct from the brackets")
+        if len(pairs) > 2 * 256:
+            raise ValueError("at most 256 bracket pairs are supported")
+        self.pairs = pairs
+        self.quotes = quotes
+        self.escape = escape
+        self.error = None
+        # Compact stack of the brackets open at the end of the previous chunks: one byte per bracket (its pair
+        # number), with its offset and line
+        self._stack = bytearray()
+        self._offsets = array('q')
+        self._lines = array('q')
+        self._quote = None  # closing quote of the quoted region that goes on in the next chunk
+        self._quote_start = None  # (offset, line) of that region
+        self._escaped = False  # the previous chunk ended on an escape character
+        self._base = 0  # offset of the current chunk
+        self._line = 1  # line at self._cursor in the current chunk
+        self._cursor = 0
+        self._kind = None  # str or bytes, fixed by the first chunk
+
+    def _setup(self, kind: type) -> None:
+        self._kind = kind
+        # Patterns are written as str and encoded for bytes chunks. Only ASCII characters can be matched byte by
+        # byte: in UTF-8, their bytes never occur inside the encoding of another character.
+        if kind is bytes and not (self.pairs + self.quotes + (self.escape or '')).isascii():
+            raise ValueError("brackets, quotes and escape must be ASCII to validate bytes")
+        convert = (lambda text: text.encode('ascii')) if kind is bytes else (lambda text: text)
+
+        self._newline = convert('\n')
+        self._openers = {convert(char): pair for pair, char in enumerate(self.pairs[::2])}
+        self._closers = {convert(char): pair for pair, char in enumerate(self.pairs[1::2])}
+        # chunk[i] is a str for str chunks and an int for bytes chunks
+        self._escape = None if self.escape is None else convert(self.escape)[0]
+
+        escape = re.escape(self.escape or '')
+        # A bracket, a whole quoted region (skipped in a single match), or a quote whose region goes on in the
+        # next chunk. Every alternative starts with a literal, which lets the regex engine skip ahead to them.
+        alternatives = [re.escape(char) for char in self.pairs]
+        for quote in self.quotes:
+            other = '[^' + re.escape(quote + (self.escape or '')) + ']'
+            body = f'{other}*(?:{escape}.{other}*)*' if self.escape is not None else f'{other}*'
+            alternatives.append(re.escape(quote) + body + re.escape(quote))
+        alternatives.extend(re.escape(quote) for quote in self.quotes)
+        self._splitter = re.compile(convert('(' + '|'.join(alternatives) + ')'), re.DOTALL)
+        # Inside a quoted region only its closing quote and the escape character matter
+        self._quoted = {convert(quote)[0]: re.compile(convert('[' + re.escape(quote + (self.escape or '')) + ']'))
+                        for quote in self.quotes}
+
+    def _line_at(self, chunk, index: int) -> int:
+        self._line += chunk.count(self._newline, self._cursor, index)
+        self._cursor = index
+        return self._line
+
+    def _fail(self, chunk, index: int, message: str) -> BracketError:
+        self.error = BracketError(self._base + index, self._line_at(chunk, index), message)
+        return self.error
+
+    def feed(self, chunk) -> BracketError | None:
+        if self.error is not None:
+            return self.error
+        if self._kind is None:
+            self._setup(bytes if isinstance(chunk, (bytes, bytearray)) else str)
+        elif isinstance(chunk, str) != (self._kind is str):
+            raise TypeError("cannot mix str and bytes chunks")
+
+        size = len(chunk)
+        position = 0
+        if self._escaped and size:
+            self._escaped, position = False, 1
+        while position < size and self.error is None:
+            if self._quote is None:
+                position = self._scan(chunk, position)
+                continue
+            match = self._quoted[self._quote].search(chunk, position)
+            if match is None:
+                break
+            index = match.start()
+            if chunk[index] == self._escape:
+                position = index + 2
+                # The escaped character is the first one of the next chunk
+                self._escaped = position > size
+            else:
+                self._quote = None
+                position = index + 1
+        if self.error is None:
+            self._line += chunk.count(self._newline, self._cursor, size)
+            self._base += size
+            self._cursor = 0
+        return self.error
+
+    def _scan(self, chunk, start: int) -> int:
+        """
+        Check the brackets of chunk[start:] outside quoted regions and return where the scan stopped: the end
+        of the chunk, or just after a quote whose region goes on past the chunk.
+
+        Only the tokens are looked at, and offsets (a sum over the split parts) are only computed for errors and
+        for the brackets still open at the end, which are moved to the compact stack.
+        """
+        parts = self._splitter.split(chunk[start:] if start else chunk)
+        tokens = parts[1::2]
+        openers, closers = self._openers, self._closers
+        stack, offsets, lines = self._stack, self._offsets, self._lines
+        opened = []  # token numbers of the brackets opened in this scan and still open
+
+        def offset_of(number):
+            # parts alternate text and tokens: token number starts after parts[:2 * number + 1]
+            return start + sum(map(len, parts[:2 * number + 1]))
+
+        stop, quote = len(chunk), None
+        for number, token in enumerate(tokens):
+            if token in openers:
+                opened.append(number)
+                continue
+            pair = closers.get(token)
+            if pair is None:
+                if len(token) == 1:
+                    # A quote without its closing quote in this chunk
+                    stop, quote = offset_of(number), token[0]
+                    break
+                continue
+            if opened:
+                expected = openers[tokens[opened[-1]]]
+                if expected == pair:
+                    opened.pop()
+                    continue
+                line = self._line_at(chunk, offset_of(opened[-1]))
+            elif stack:
+                expected = stack[-1]
+                if expected == pair:
+                    stack.pop()
+                    offsets.pop()
+                    lines.pop()
+                    continue
+                line = lines[-1]
+            else:
+                self._fail(chunk, offset_of(number), f"unexpected {self.pairs[2 * pair + 1]!r}")
+                return stop
+            opener, closer = self.pairs[2 * expected:2 * expected + 2]
+            self._fail(chunk, offset_of(number), f"expected {closer!r} to close {opener!r} from line {line}, "
+                                                 f"found {self.pairs[2 * pair + 1]!r}")
+            return stop
+
+        if opened:
+            starts = list(accumulate(map(len, parts[:2 * opened[-1] + 1])))
+            for number in opened:
+                index = start + starts[2 * number]
+                stack.append(openers[tokens[number]])
+                offsets.append(self._base + index)
+                lines.append(self._line_at(chunk, index))
+        if quote is not None:
+            self._quote = quote
+            self._quote_start = (self._base + stop, self._line_at(chunk, stop))
+            stop += 1
+        return stop
+
+    def close(self) -> BracketError | None:
+        """Finish the input and return the first error, including unclosed brackets and quotes."""
+        if self.error is None:
+            if self._quote is not None:
+                offset, line = self._quote_start
+                quote = chr(self._quote) if self._kind is bytes else self._quote
+                self.error = BracketError(offset, line, f"unterminated quote {quote!r}")
+            elif self._stack:
+                opener = self.pairs[2 * self._stack[-1]]
+                self.error = BracketError(self._offsets[-1], self._lines[-1], f"unclosed {opener!r}")
+        return self.error
+
+
+def validate(chunks, **options) -> BracketError | None:
+    """Validate an iterable of str or bytes chunks; options are those of BracketValidator."""
+    validator = BracketValidator(**options)
+    for chunk in chunks:
+        if validator.feed(chunk) is not None:
+            break
+    return validator.close()
+
+
+def file_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = True):
+    """Yield the bytes of a file chunk_size at a time, sliced from a memory map unless use_mmap is False."""
+    with open(path, 'rb') as f:
+        if use_mmap:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return
+            with mapped:
+                for start in range(0, len(mapped), chunk_size):
+                    yield mapped[start:start + chunk_size]
+        else:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+
+def validate_file(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = True,
+                  **options) -> BracketError | None:
+    """Validate a file of any size in bounded memory; offsets are in bytes."""
+    return validate(file_chunks(path, chunk_size, use_mmap), **options)
+
+
+if __name__ == '__main__':
+    import os
+    import random
+    import runpy
+    import tempfile
+    import timeit
+
+    isValid2 = runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                           'Valid-Parentheses.py'))['isValid2']
+
+    for s in ("()", "()[]{}", "(]", "([)]", "{[]}", "((", "f(\"a)\\\"\")", "x = 'a(\nb'\n)"):
+        print(repr(s), validate([s]))
+    print(validate(['a<b', '<c>', '>'], pairs='<>', quotes=''))
+
+    random.seed(0)
+    lines = []
+    for number in range(400_000):
+        depth = number % 7
+        lines.append('  ' * depth + f'key_{number} = {{"name": "item[{number}]", "values": [{number}, {number * 2}]}}')
+    text = '\n'.join(lines) + '\n'
+    middle = text.index('\n', len(text) // 2)
+    broken = text[:middle] + ']' + text[middle:]
+
+    path = os.path.join(tempfile.gettempdir(), f'brackets-{os.getpid()}.txt')
+    try:
+        with open(path, 'w') as f:
+            f.write(broken)
+        print(f"{len(broken) / 1e6:.0f} MB with a stray ']':", validate_file(path))
+
+        with open(path, 'w') as f:
+            f.write(text)
+        brackets_only = ''.join(c for c in text if c in '()[]{}')
+        runs = [
+            ('isValid2 (brackets only, in memory)', lambda: isValid2(brackets_only)),
+            ('validate_file mmap', lambda: validate_file(path)),
+            ('validate_file read', lambda: validate_file(path, use_mmap=False)),
+            ('validate str chunks', lambda: validate(text[i:i + DEFAULT_CHUNK_SIZE]
+                                                     for i in range(0, len(text), DEFAULT_CHUNK_SIZE))),
+        ]
+        for label, run in runs:
+            elapsed = timeit.timeit(run, number=1)
+            print(f"  {label:36} {elapsed * 1000:7.0f} ms")
+    finally:
+        os.remove(path)
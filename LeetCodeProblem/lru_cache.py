@@ -0,0 +1,194 @@
+"""
+Reusable LRU cache: optional TTL, weight-based capacity, hit/miss/eviction
+counters, a thread-safe variant and a @cached decorator.
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+CacheStats = namedtuple('CacheStats', ['hits', 'misses', 'evictions', 'expirations', 'size', 'weight'])
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Least-recently-used cache.
+
+    ``capacity`` is a number of items, or a total weight when ``weigher`` is
+    given (e.g. ``weigher=len`` on bytes values to bound the cache in bytes).
+    With ``ttl`` (seconds) entries expire that long after they were stored.
+    """
+
+    def __init__(self, capacity: int, ttl: float = None, weigher=None, clock=time.monotonic):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.ttl = ttl
+        self.weigher = weigher
+        self.clock = clock
+        # key -> (value, expires_at, weight)
+        self.cache = OrderedDict()
+        self.weight = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key, default=None):
+        entry = self.cache.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+        if entry[1] is not None and entry[1] <= self.clock():
+            self._remove(key, entry)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value) -> None:
+        weight = self.weigher(value) if self.weigher else 1
+        old = self.cache.pop(key, _MISSING)
+        if old is not _MISSING:
+            self.weight -= old[2]
+        if weight > self.capacity:
+            # Would evict everything and still not fit
+            return
+
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        self.cache[key] = (value, expires_at, weight)
+        self.weight += weight
+        while self.weight > self.capacity:
+            _, entry = self.cache.popitem(last=False)
+            self.weight -= entry[2]
+            self.evictions += 1
+
+    def pop(self, key, default=None):
+        entry = self.cache.pop(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        self.weight -= entry[2]
+        return entry[0]
+
+    def _remove(self, key, entry) -> None:
+        del self.cache[key]
+        self.weight -= entry[2]
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters, like functools.lru_cache's cache_clear()."""
+        self.cache.clear()
+        self.weight = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __contains__(self, key) -> bool:
+        entry = self.cache.get(key, _MISSING)
+        return entry is not _MISSING and (entry[1] is None or entry[1] > self.clock())
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, self.expirations, len(self.cache), self.weight)
+
+
+class ThreadSafeLRUCache(LRUCache):
+    """LRUCache whose operations are serialized by a lock."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            return super().get(key, default)
+
+    def put(self, key, value) -> None:
+        with self.lock:
+            super().put(key, value)
+
+    def pop(self, key, default=None):
+        with self.lock:
+            return super().pop(key, default)
+
+    def clear(self) -> None:
+        with self.lock:
+            super().clear()
+
+    def __contains__(self, key) -> bool:
+        with self.lock:
+            return super().__contains__(key)
+
+    def __len__(self) -> int:
+        with self.lock:
+            return super().__len__()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self.lock:
+            return super().stats
+
+
+def cached(capacity: int = 128, ttl: float = None, weigher=None, thread_safe: bool = False):
+    """
+    Memoize a function in an LRUCache keyed on its arguments.
+
+    The wrapper exposes ``cache``, ``cache_info()`` and ``cache_clear()``.
+    Concurrent misses on the thread-safe variant may compute the same value
+    twice; the lock is not held while the function runs.
+    """
+    def decorator(function):
+        cache = (ThreadSafeLRUCache if thread_safe else LRUCache)(capacity, ttl, weigher)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            key = (args, frozenset(kwargs.items())) if kwargs else args
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = function(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_info = lambda: cache.stats
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+if __name__ == '__main__':
+    import functools
+    import random
+    import timeit
+
+    cache = LRUCache(2)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    print('get ', cache.get(1))  # renvoie 1
+    cache.put(3, 3)  # La clé LRU était 2, supprime la clé 2
+    print('get ', cache.get(2))  # renvoie None (non trouvé)
+    print(cache.stats)
+
+    sized = LRUCache(10, weigher=len)
+    sized.put('a', b'12345')
+    sized.put('b', b'123456')  # 11 octets > 10, supprime 'a'
+    print('a' in sized, sized.stats)
+
+    random.seed(0)
+    keys = [random.randrange(2000) for _ in range(200_000)]
+
+    def square(x):
+        return x * x
+
+    for label, decorate in (
+        ('functools.lru_cache', functools.lru_cache(maxsize=1024)),
+        ('cached', cached(1024)),
+        ('cached ttl', cached(1024, ttl=60)),
+        ('cached thread_safe', cached(1024, thread_safe=True)),
+    ):
+        function = decorate(square)
+        elapsed = timeit.timeit(lambda: [function(k) for k in keys], number=5) / 5
+        print(f"{label:20} {elapsed * 1000:6.1f} ms  {function.cache_info()}")
@@ -0,0 +1,143 @@
+"""
+Reusable index for two-sum / k-sum queries on one integer array.
+
+The values are sorted once (with the permutation back to the original
+indices); every query is then a vectorized searchsorted over that sorted
+array instead of a Python loop rebuilding a dict like twoSum2, or scanning
+the list like twoSum.
+"""
+
+import numpy as np
+
+# Values scanned per target in the first block, doubled for every following block
+INITIAL_BLOCK = 256
+# Maximum size of a (targets x values) block
+BLOCK_ELEMENTS = 1 << 22
+
+
+class SumIndex:
+    def __init__(self, nums: list[int]):
+        self.values = np.asarray(nums, dtype=np.int64)
+        self.order = np.argsort(self.values, kind='stable')
+        self.sorted = self.values[self.order]
+
+    def __len__(self) -> int:
+        return self.sorted.size
+
+    def indices_of(self, value: int) -> list[int]:
+        """Original indices holding value, in increasing order."""
+        left = np.searchsorted(self.sorted, value, 'left')
+        right = np.searchsorted(self.sorted, value, 'right')
+        return self.order[left:right].tolist()
+
+    def _first_pairs(self, targets: np.ndarray) -> list[list[int]]:
+        """
+        First pair of every target. The values are scanned in input order, in growing blocks for all
+        unresolved targets at once, and their complements looked up in the sorted array. A target leaves
+        the scan as soon as a block holds its pair, so like twoSum2 the work stops early when pairs are common.
+        """
+        pairs = [[] for _ in range(targets.size)]
+        pending = np.arange(targets.size)
+        start, width = 0, INITIAL_BLOCK
+        while pending.size and start < self.values.size:
+            stop = min(self.values.size, start + max(1, min(width, BLOCK_ELEMENTS // pending.size)))
+            values = self.values[start:stop]
+            complements = targets[pending, None] - values[None, :]
+            left = np.searchsorted(self.sorted, complements, 'left')
+            right = np.searchsorted(self.sorted, complements, 'right')
+            # The complement must exist, and be another element when it equals the value itself
+            valid = (right > left) & ((complements != values) | (right - left >= 2))
+            found = valid.any(axis=1)
+            for row in np.flatnonzero(found).tolist():
+                column = int(valid[row].argmax())
+                index, partner = start + column, int(self.order[left[row, column]])
+                if partner == index:
+                    partner = int(self.order[left[row, column] + 1])
+                pairs[pending[row]] = sorted((index, partner))
+            pending = pending[~found]
+            start, width = stop, width * 2
+        return pairs
+
+    def two_sum(self, target: int) -> list[int]:
+        """Indices [i, j] (i < j) of two elements adding up to target, or [] if there are none."""
+        return self._first_pairs(np.array([target], dtype=np.int64))[0]
+
+    def two_sum_batch(self, targets: list[int]) -> list[list[int]]:
+        """two_sum for every target, answered together."""
+        return self._first_pairs(np.asarray(targets, dtype=np.int64))
+
+    def k_sum(self, k: int, target: int) -> list[tuple[int, ...]]:
+        """Every distinct combination of k values (in increasing order) adding up to target."""
+        if k < 2:
+            raise ValueError("k must be at least 2")
+        return [tuple(int(value) for value in combination)
+                for combination in _k_sum(self.sorted, k, target)]
+
+    def three_sum(self, target: int = 0) -> list[tuple[int, int, int]]:
+        return self.k_sum(3, target)
+
+
+def _pairs(values: np.ndarray, target: int) -> list[tuple]:
+    """Distinct value pairs (a <= b) of the sorted values adding up to target."""
+    if values.size < 2:
+        return []
+    complements = target - values
+    last = np.searchsorted(values, complements, 'right') - 1
+    first_occurrence = np.ones(values.size, dtype=bool)
+    first_occurrence[1:] = values[1:] != values[:-1]
+    positions = np.arange(values.size)
+    # The complement must be at a later position, which also keeps a <= b and each pair once
+    valid = first_occurrence & (complements >= values) & (last > positions) & (values[last.clip(0)] == complements)
+    return list(zip(values[valid], complements[valid]))
+
+
+def _k_sum(values: np.ndarray, k: int, target: int) -> list[tuple]:
+    if k == 2:
+        return _pairs(values, target)
+    combinations = []
+    for position in range(values.size - k + 1):
+        value = values[position]
+        if position and value == values[position - 1]:
+            continue
+        # Sorted values: every later combination sums to at least k * value
+        if value * k > target:
+            break
+        for rest in _k_sum(values[position + 1:], k - 1, target - value):
+            combinations.append((value,) + rest)
+    return combinations
+
+
+if __name__ == '__main__':
+    import random
+    import timeit
+
+    from twoSum import twoSum, twoSum2
+
+    print(SumIndex([2, 7, 11, 15]).two_sum(9), SumIndex([3, 3]).two_sum(6), SumIndex([3, 2, 4]).two_sum(6))
+    print(SumIndex([-1, 0, 1, 2, -1, -4]).three_sum())
+    print(SumIndex([1, 0, -1, 0, -2, 2]).k_sum(4, 0))
+
+    random.seed(0)
+    for size, queries in ((2_000, 20), (100_000, 2_000)):
+        nums = [random.randrange(-10 * size, 10 * size) for _ in range(size)]
+        targets = [random.randrange(-10 * size, 10 * size) for _ in range(queries)]
+        index = SumIndex(nums)
+        for target, pair in zip(targets, index.two_sum_batch(targets)):
+            assert (twoSum2(nums, target) is None) == (not pair)
+            assert not pair or nums[pair[0]] + nums[pair[1]] == target
+
+        runs = [
+            ('twoSum2 per target', lambda: [twoSum2(nums, target) for target in targets]),
+            ('SumIndex build + batch', lambda: SumIndex(nums).two_sum_batch(targets)),
+            ('SumIndex batch', lambda: index.two_sum_batch(targets)),
+        ]
+        if size <= 2_000:
+            runs.insert(0, ('twoSum per target', lambda: [twoSum(nums, target) for target in targets]))
+        print(f"{size} values, {queries} targets")
+        for label, run in runs:
+            elapsed = timeit.timeit(run, number=1)
+            print(f"  {label:24} {elapsed * 1000:9.1f} ms")
+
+    nums = [random.randrange(-2_000, 2_000) for _ in range(2_000)]
+    elapsed = timeit.timeit(lambda: SumIndex(nums).three_sum(), number=1)
+    print(f"three_sum on 2000 values: {elapsed * 1000:.0f} ms")
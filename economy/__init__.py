@@ -0,0 +1,8 @@
+"""
+Engineering-economy toolkit: interest factors (economy.economy), cash-flow analysis, schedules, factor tables,
+sensitivity analysis and benchmarks.
+
+The modules import each other relatively, so use them as the ``economy`` package with the repository root on
+``sys.path``, e.g. ``from economy.cashflow import irr``, and run their demos as modules from the repository
+root: ``python -m economy.cashflow``, ``python -m economy.bench accuracy``.
+"""
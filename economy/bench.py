@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Accuracy and speed checks for the interest factors.
+
+Usage (from the repository root):
+    python -m economy.bench accuracy [--tolerance REL]
+    python -m economy.bench speed [--iterations N]
+"""
+
+import argparse
+import sys
+import timeit
+from decimal import Decimal, localcontext
+from fractions import Fraction
+
+import numpy as np
+
+from .economy import A_F_factor, A_G_factor, A_P_factor, F_A_factor, P_A_factor, P_G_factor, P_G_factors
+
+# Largest relative error accepted against the high-precision references
+ACCURACY_TOLERANCE = 1e-12
+
+ACCURACY_RATES = ('0', '1e-12', '1e-9', '1e-6', '1e-4', '0.001', '0.01', '0.25', '1', '5', '12.5', '25', '-0.5')
+ACCURACY_PERIODS = (1, 2, 3, 10, 30, 100, 400, 1000, 10000, 100000)
+FRACTIONAL_PERIODS = ('0.5', '2.5', '12.25', '399.75')
+# Exact fractions grow with n; above this the 60-digit decimal reference is used instead
+FRACTION_MAX_N = 1000
+
+# Factors timed by the speed suite, called per scalar (i, n) and once over the whole grid
+SPEED_FACTORS = {
+    'P/A': P_A_factor,
+    'F/A': F_A_factor,
+    'A/P': A_P_factor,
+    'A/F': A_F_factor,
+    'A/G': A_G_factor,
+    'P/G': P_G_factor,
+}
+
+
+def P_G_scalar(i, n):
+    """The original scalar formula, kept as the speed baseline."""
+    i_float = i / 100
+    terme_1 = pow((1 + i_float), n)
+    terme_2 = (terme_1 - 1) / (i_float * terme_1)
+    terme_3 = n / terme_1
+    calc = terme_2 - terme_3
+
+    p_g = (1 / i_float) * calc
+
+    return p_g
+
+
+def P_G_exact(rate: str, n: int) -> Fraction:
+    """Exact P/G for a decimal-string rate and integer n."""
+    i = Fraction(rate) / 100
+    if i == 0:
+        return Fraction(n * (n - 1), 2)
+    growth = (1 + i) ** n
+    return (growth - 1 - n * i) / (i * i * growth)
+
+
+def P_G_decimal(rate: str, n: str) -> Decimal:
+    """P/G at 60 significant digits, for non-integer or large n."""
+    with localcontext() as context:
+        context.prec = 60
+        i = Decimal(rate) / 100
+        n = Decimal(n)
+        if i == 0:
+            return n * (n - 1) / 2
+        growth = (1 + i) ** n
+        return +((growth - 1 - n * i) / (i * i * growth))
+
+
+def P_G_reference(rate: str, n) -> Fraction:
+    if isinstance(n, int) and n <= FRACTION_MAX_N:
+        return P_G_exact(rate, n)
+    return Fraction(P_G_decimal(rate, str(n)))
+
+
+def A_G_exact(rate: str, n: int) -> Fraction:
+    """Exact A/G for a decimal-string rate and integer n."""
+    i = Fraction(rate) / 100
+    if i == 0:
+        return Fraction(n - 1, 2)
+    return 1 / i - n / ((1 + i) ** n - 1)
+
+
+def A_G_decimal(rate: str, n: str) -> Decimal:
+    """A/G at 60 significant digits, for non-integer or large n."""
+    with localcontext() as context:
+        context.prec = 60
+        i = Decimal(rate) / 100
+        n = Decimal(n)
+        if i == 0:
+            return (n - 1) / 2
+        return +(1 / i - n / ((1 + i) ** n - 1))
+
+
+def A_G_reference(rate: str, n) -> Fraction:
+    if isinstance(n, int) and n <= FRACTION_MAX_N:
+        return A_G_exact(rate, n)
+    return Fraction(A_G_decimal(rate, str(n)))
+
+
+def relative_error(value, exact) -> float:
+    if exact == 0:
+        return abs(float(value))
+    return abs(float((Fraction(float(value)) - Fraction(exact)) / Fraction(exact)))
+
+
+def bench_accuracy(tolerance: float) -> bool:
+    """
+    Compare P_G_factor, P_G_factors and A_G_factor against high-precision references; False when over
+    tolerance.
+    """
+    worst = (0.0, "")
+    for rate in ACCURACY_RATES:
+        exact = [P_G_reference(rate, n) for n in ACCURACY_PERIODS]
+        computed = P_G_factor(float(rate), np.array(ACCURACY_PERIODS))
+        batched = P_G_factors(float(rate), max(ACCURACY_PERIODS))[list(ACCURACY_PERIODS)]
+        for n, reference, value, batch_value in zip(ACCURACY_PERIODS, exact, computed, batched):
+            for label, candidate in (('P_G_factor', value), ('P_G_factors', batch_value)):
+                error = relative_error(candidate, reference)
+                worst = max(worst, (error, f"{label}({rate}, {n})"))
+        for n in FRACTIONAL_PERIODS:
+            error = relative_error(P_G_factor(float(rate), float(n)), P_G_reference(rate, n))
+            worst = max(worst, (error, f"P_G_factor({rate}, {n})"))
+
+        a_g = A_G_factor(float(rate), np.array(ACCURACY_PERIODS))
+        for n, value in zip(ACCURACY_PERIODS, a_g):
+            worst = max(worst, (relative_error(value, A_G_reference(rate, n)), f"A_G_factor({rate}, {n})"))
+        for n in FRACTIONAL_PERIODS:
+            error = relative_error(A_G_factor(float(rate), float(n)), A_G_reference(rate, n))
+            worst = max(worst, (error, f"A_G_factor({rate}, {n})"))
+
+    error, where = worst
+    print(f"Worst relative error: {error:.2e} at {where} (tolerance {tolerance:.0e})")
+    old_error = relative_error(P_G_scalar(1e-4, 10), P_G_exact('1e-4', 10))
+    print(f"Original formula at P/G(1e-4 %, 10): {old_error:.2e}")
+    return error <= tolerance
+
+
+def bench_speed(iterations: int) -> None:
+    """
+    Time every factor of SPEED_FACTORS looped over scalar (i, n) pairs against one broadcast call, then the
+    original scalar P/G formula against the broadcast grid and the n-batched cumulative path.
+    """
+    rates = np.linspace(0.25, 25, 100)
+    periods = np.arange(1, 401)
+    pairs = [(float(i), int(n)) for i in rates for n in periods]
+
+    print(f"Factors for {rates.size} rates x {periods.size} periods: scalar loop vs broadcast grid")
+    for label, factor in SPEED_FACTORS.items():
+        grid = factor(rates[:, None], periods[None, :])
+        start = timeit.default_timer()
+        looped = [factor(i, n) for i, n in pairs]
+        loop_time = timeit.default_timer() - start
+        assert np.allclose(looped, grid.ravel(), rtol=1e-12)
+        grid_time = timeit.timeit(lambda: factor(rates[:, None], periods[None, :]), number=iterations) / iterations
+        print(f"  {label:4} {loop_time * 1000:8.1f} ms  {grid_time * 1000:8.2f} ms  ({loop_time / grid_time:.0f}x)")
+
+    runs = (
+        ('scalar loop', lambda: [P_G_scalar(i, n) for i, n in pairs]),
+        ('P_G_factor grid', lambda: P_G_factor(rates[:, None], periods[None, :])),
+        ('P_G_factors', lambda: P_G_factors(rates, periods[-1])),
+    )
+    baseline = None
+    print(f"P/G paths for {rates.size} rates x {periods.size} periods")
+    for label, run in runs:
+        elapsed = timeit.timeit(run, number=iterations) / iterations
+        baseline = baseline or elapsed
+        print(f"  {label:16} {elapsed * 1000:8.2f} ms  ({baseline / elapsed:.0f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Interest factor benchmarks')
+    parser.add_argument('suite', choices=['accuracy', 'speed'], help='Benchmark to run.')
+    parser.add_argument('--tolerance', type=float, default=ACCURACY_TOLERANCE,
+                        help='Largest relative error accepted by the accuracy suite.')
+    parser.add_argument('--iterations', type=int, default=10, help='Runs per timing in the speed suite.')
+    args = parser.parse_args()
+
+    if args.suite == 'accuracy':
+        if not bench_accuracy(args.tolerance):
+            sys.exit(1)
+    else:
+        bench_speed(args.iterations)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,166 @@
+"""
+Engineering-economy interest factors.
+
+Every factor takes the interest rate ``i`` in percent (5 means 5 %) and the
+number of periods ``n``. Both may be scalars or NumPy arrays; arrays broadcast
+against each other, so ``P_A_factor(rates[:, None], periods[None, :])`` gives
+the whole (i, n) grid at once. Scalar inputs return a scalar.
+
+``i = 0`` is not a special case for the caller: each factor returns its
+limit (e.g. P/A = n, P/G = n(n-1)/2) instead of dividing by zero. Growth
+(1 + i)^n is computed as exp(n log1p(i)) and differences such as
+(1 + i)^n - 1 with expm1, so small rates keep full precision.
+"""
+
+import numpy as np
+
+# Below this |n * i| the P/G closed form cancels badly and the series is used;
+# at the threshold the truncated series is accurate to double precision.
+SERIES_THRESHOLD = 0.05
+SERIES_TERMS = 12
+
+
+def _prepare(i, n):
+    i_float = np.asarray(i, dtype=float) / 100
+    n = np.asarray(n, dtype=float)
+    i_float, n = np.broadcast_arrays(i_float, n)
+    zero = i_float == 0
+    # Placeholder rate where i = 0 so the general formula never divides by zero
+    i_safe = np.where(zero, 1.0, i_float)
+    return i_safe, n, zero
+
+
+def _result(values):
+    return values[()] if values.ndim == 0 else values
+
+
+def F_P_factor(i, n):
+    """(F/P, i, n): future value of a single present amount."""
+    i_float = np.asarray(i, dtype=float) / 100
+    return _result(np.power(1 + i_float, np.asarray(n, dtype=float)))
+
+
+def P_F_factor(i, n):
+    """(P/F, i, n): present value of a single future amount."""
+    i_float = np.asarray(i, dtype=float) / 100
+    return _result(np.power(1 + i_float, -np.asarray(n, dtype=float)))
+
+
+def P_A_factor(i, n):
+    """(P/A, i, n): present value of a uniform series."""
+    i_safe, n, zero = _prepare(i, n)
+    p_a = -np.expm1(-n * np.log1p(i_safe)) / i_safe
+    return _result(np.where(zero, n, p_a))
+
+
+def A_P_factor(i, n):
+    """(A/P, i, n): capital recovery factor."""
+    i_safe, n, zero = _prepare(i, n)
+    with np.errstate(divide='ignore'):
+        a_p = np.where(zero, 1 / n, i_safe / -np.expm1(-n * np.log1p(i_safe)))
+    return _result(a_p)
+
+
+def F_A_factor(i, n):
+    """(F/A, i, n): future value of a uniform series."""
+    i_safe, n, zero = _prepare(i, n)
+    f_a = np.expm1(n * np.log1p(i_safe)) / i_safe
+    return _result(np.where(zero, n, f_a))
+
+
+def A_F_factor(i, n):
+    """(A/F, i, n): sinking fund factor."""
+    i_safe, n, zero = _prepare(i, n)
+    with np.errstate(divide='ignore'):
+        a_f = np.where(zero, 1 / n, i_safe / np.expm1(n * np.log1p(i_safe)))
+    return _result(a_f)
+
+
 def P_G_factor(i, n):
-    i_float = i / 100
-    terme_1 = pow((1 + i_float), n)
-    terme_2 = (terme_1 - 1) / (i_float * terme_1)
-    terme_3 = n / terme_1
-    calc = terme_2 - terme_3
+    """
+    (P/G, i, n): present value of an arithmetic gradient.
+
+    Uses (1 + i)^-n = exp(-n log1p(i)) so large n underflows to the 1/i^2
+    limit instead of overflowing. When |n i| is small the closed form loses
+    digits to cancellation, so those values (and n = 1, where it should be
+    exactly 0) come from its power series in i, which also gives the exact
+    n(n-1)/2 at i = 0.
+    """
+    i_float = np.asarray(i, dtype=float) / 100
+    i_float, n = np.broadcast_arrays(i_float, np.asarray(n, dtype=float))
+    small = (np.abs(n * i_float) < SERIES_THRESHOLD) | (n == 1)
+    i_safe = np.where(small, 1.0, i_float)
+
+    log_growth = n * np.log1p(i_safe)
+    terme_2 = -np.expm1(-log_growth) / i_safe
+    terme_3 = n * np.exp(-log_growth)
+    p_g = np.asarray((terme_2 - terme_3) / i_safe)
+
+    if small.any():
+        p_g[small] = _P_G_series(i_float[small], n[small])
+    return _result(p_g)
+
+
+def _P_G_series(i_float, n):
+    # P/G = sum_m (-i)^m / m! * (n-1) n (n+1) ... (n+m) / (m+2)
+    term = n * (n - 1) / 2
+    total = term.copy()
+    for m in range(SERIES_TERMS - 1):
+        term = term * -i_float * (n + m + 1) / (m + 1) * (m + 2) / (m + 3)
+        total += term
+    return total
+
+
+def P_G_factors(i, max_n):
+    """
+    (P/G, i, n) for every n = 0..max_n, along a new last axis.
+
+    Accumulates P/G(n) = P/G(n - 1) + (n - 1)(1 + i)^-n, a sum of same-sign
+    terms, which is both exact to rounding and cheaper than one call per n.
+    """
+    i_float = np.asarray(i, dtype=float)[..., None] / 100
+    k = np.arange(max_n + 1)
+    return np.cumsum((k - 1).clip(0) * np.exp(-k * np.log1p(i_float)), axis=-1)
+
+
+def A_G_factor(i, n):
+    """
+    (A/G, i, n): uniform series equivalent to an arithmetic gradient.
+
+    The closed form 1/i - n/((1 + i)^n - 1) cancels like P/G when |n i| is
+    small, so those values come from P/G's power series times A/P, which
+    tends to the exact (n-1)/2 at i = 0.
+    """
+    i_float = np.asarray(i, dtype=float) / 100
+    i_float, n = np.broadcast_arrays(i_float, np.asarray(n, dtype=float))
+    small = np.abs(n * i_float) < SERIES_THRESHOLD
+    i_safe = np.where(small, 1.0, i_float)
+
+    # (1 + i)^n overflowing for large n gives the 1/i limit
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        a_g = np.asarray(1 / i_safe - n / np.expm1(n * np.log1p(i_safe)))
+        if small.any():
+            i_small, n_small = i_float[small], n[small]
+            zero = i_small == 0
+            growth = -np.expm1(-n_small * np.log1p(i_small))
+            a_p = np.where(zero, 1 / n_small, i_small / np.where(zero, 1.0, growth))
+            a_g[small] = _P_G_series(i_small, n_small) * a_p
+    return _result(a_g)
 
-    p_g = (1 / i_float) * calc
 
-    return p_g
+def P_A1_factor(i, g, n):
+    """(P/A1, i, g, n): present value of a geometric gradient growing at g percent."""
+    i_float = np.asarray(i, dtype=float) / 100
+    g_float = np.asarray(g, dtype=float) / 100
+    n = np.asarray(n, dtype=float)
+    i_float, g_float, n = np.broadcast_arrays(i_float, g_float, n)
+    equal = i_float == g_float
+    # Placeholder growth where g = i so the general formula never divides by zero
+    g_safe = np.where(equal, i_float - 1, g_float)
+    terme_1 = np.power((1 + g_safe) / (1 + i_float), n)
+    p_a1 = (1 - terme_1) / (i_float - g_safe)
+    return _result(np.where(equal, n / (1 + i_float), p_a1))
 
 
-print(P_G_factor(5, 5))
+if __name__ == '__main__':
+    print(P_G_factor(5, 5))
@@ -0,0 +1,200 @@
+"""
+Monte Carlo sensitivity analysis for the interest factors.
+
+Inputs are described as distributions, e.g. ``{'i': ('normal', 6, 1.5),
+'n': ('integers', 10, 31), 'G': ('uniform', 800, 1200)}``: each tuple names a
+``numpy.random.Generator`` method followed by its arguments, and a plain number
+is a constant. monte_carlo() samples them in chunks, evaluates the model on
+each chunk and folds the results into a Summary, so memory stays bounded by
+the chunk size whatever the number of samples. Chunks are seeded from one
+SeedSequence, so a given seed gives the same result with or without workers.
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .economy import P_G_factor
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with a bounded relative error.
+
+    Values are counted in logarithmic buckets of ratio (1 + a) / (1 - a), so
+    any quantile is returned within a relative error ``a`` of the exact one
+    and two sketches merge by adding their bucket counts.
+    """
+
+    def __init__(self, relative_accuracy=0.001):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.positive = {}
+        self.negative = {}
+        self.zeros = 0
+        self.count = 0
+
+    def _add_buckets(self, store, values):
+        keys, counts = np.unique(np.ceil(np.log(values) / self.log_gamma).astype(np.int64), return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            store[key] = store.get(key, 0) + count
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        self._add_buckets(self.positive, values[values > 0])
+        self._add_buckets(self.negative, -values[values < 0])
+        self.zeros += int(np.count_nonzero(values == 0))
+        self.count += values.size
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for store, other_store in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+
+    def _bucket_value(self, key):
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, q):
+        if self.count == 0:
+            return math.nan
+        rank = q * (self.count - 1)
+
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._bucket_value(key)
+        seen += self.zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._bucket_value(key)
+        return self._bucket_value(max(self.positive))
+
+
+class Summary:
+    """Streaming count, mean, variance, extrema and quantiles; mergeable across chunks."""
+
+    def __init__(self, relative_accuracy=0.001):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    @classmethod
+    def of(cls, values, relative_accuracy=0.001):
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        summary = cls(relative_accuracy)
+        if values.size:
+            summary.count = values.size
+            summary.mean = float(values.mean())
+            summary.m2 = float(np.sum((values - summary.mean) ** 2))
+            summary.min = float(values.min())
+            summary.max = float(values.max())
+            summary.sketch.update(values)
+        return summary
+
+    def merge(self, other):
+        """Fold another summary in (Chan et al. parallel variance)."""
+        if other.count:
+            count = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / count
+            self.m2 += other.m2 + delta * delta * self.count * other.count / count
+            self.count = count
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+    def as_dict(self, quantiles=(0.05, 0.5, 0.95)):
+        result = {'count': self.count, 'mean': self.mean, 'std': self.std, 'min': self.min, 'max': self.max}
+        result.update({f"p{q * 100:g}": self.quantile(q) for q in quantiles})
+        return result
+
+
+def sample(distribution, generator, size):
+    """Draw ``size`` values from a distribution tuple, or repeat a constant."""
+    if isinstance(distribution, tuple):
+        method, *parameters = distribution
+        return getattr(generator, method)(*parameters, size=size)
+    return np.full(size, distribution, dtype=float)
+
+
+def P_G_model(i, n, G=1.0):
+    """Default model: present worth of an arithmetic gradient G over n periods at i percent."""
+    return G * P_G_factor(i, n)
+
+
+def _evaluate_chunk(model, inputs, size, seed, relative_accuracy):
+    generator = np.random.default_rng(seed)
+    samples = {name: sample(distribution, generator, size) for name, distribution in inputs.items()}
+    return Summary.of(model(**samples), relative_accuracy)
+
+
+def monte_carlo(inputs, samples, model=P_G_model, chunk_size=DEFAULT_CHUNK_SIZE,
+                workers=None, seed=None, relative_accuracy=0.001):
+    """
+    Evaluate ``model(**inputs)`` over ``samples`` draws and return a Summary.
+
+    With ``workers`` the chunks run in a process pool; ``model`` must then be
+    a module-level function so it can be pickled.
+    """
+    sizes = [chunk_size] * (samples // chunk_size)
+    if samples % chunk_size:
+        sizes.append(samples % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    chunks = [(model, inputs, size, chunk_seed, relative_accuracy) for size, chunk_seed in zip(sizes, seeds)]
+
+    summary = Summary(relative_accuracy)
+    if workers:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_summary in executor.map(_evaluate_chunk, *zip(*chunks)):
+                summary.merge(chunk_summary)
+    else:
+        for chunk in chunks:
+            summary.merge(_evaluate_chunk(*chunk))
+    return summary
+
+
+if __name__ == '__main__':
+    import os
+    from time import perf_counter
+
+    inputs = {'i': ('normal', 6, 1.5), 'n': ('integers', 10, 31), 'G': ('uniform', 800, 1200)}
+    for workers in (None, os.cpu_count()):
+        start = perf_counter()
+        summary = monte_carlo(inputs, 10_000_000, workers=workers, seed=42)
+        elapsed = perf_counter() - start
+        print(f"workers={workers}: {elapsed:.2f} s", summary.as_dict())
+
+    values = P_G_model(**{name: sample(d, np.random.default_rng(0), 1_000_000) for name, d in inputs.items()})
+    sketch = Summary.of(values)
+    for q in (0.01, 0.5, 0.99):
+        exact = np.quantile(values, q)
+        print(f"q={q}: sketch {sketch.quantile(q):.2f}, exact {exact:.2f}")
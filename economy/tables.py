@@ -0,0 +1,146 @@
+"""
+Precomputed interest-factor tables.
+
+build_table() writes every factor of economy.py for a regular grid of rates
+and n = 0..max_n into a flat float64 file: a 4-value header (first rate, rate
+step, number of rates, max_n) followed by a (factor, rate, n) array.
+InterestTable memory-maps that file, so opening it reads nothing up front and
+lookups index straight into the mapped pages.
+"""
+
+import numpy as np
+
+from .economy import (
+    A_F_factor,
+    A_G_factor,
+    A_P_factor,
+    F_A_factor,
+    F_P_factor,
+    P_A_factor,
+    P_F_factor,
+    P_G_factor,
+)
+
+FACTORS = {
+    'P/F': P_F_factor,
+    'F/P': F_P_factor,
+    'A/P': A_P_factor,
+    'P/A': P_A_factor,
+    'A/F': A_F_factor,
+    'F/A': F_A_factor,
+    'P/G': P_G_factor,
+    'A/G': A_G_factor,
+}
+
+HEADER_SIZE = 4
+
+
+def build_table(path, first_rate=0.25, last_rate=25.0, step=0.25, max_n=400):
+    """Compute all factors for rates first_rate..last_rate (percent) and write them to ``path``."""
+    count = int(round((last_rate - first_rate) / step)) + 1
+    if count < 2:
+        raise ValueError("A table needs at least two rates to interpolate between")
+    rates = first_rate + step * np.arange(count)
+    periods = np.arange(max_n + 1)
+
+    values = np.empty((len(FACTORS), count, max_n + 1))
+    for row, factor in enumerate(FACTORS.values()):
+        values[row] = factor(rates[:, None], periods[None, :])
+
+    with open(path, 'wb') as f:
+        np.array([first_rate, step, count, max_n], dtype=np.float64).tofile(f)
+        values.tofile(f)
+
+
+class InterestTable:
+    """Memory-mapped factor table with linear interpolation between tabulated rates."""
+
+    def __init__(self, path):
+        header = np.fromfile(path, dtype=np.float64, count=HEADER_SIZE)
+        self.first_rate, self.step = float(header[0]), float(header[1])
+        self.count, self.max_n = int(header[2]), int(header[3])
+        self.values = np.memmap(
+            path, dtype=np.float64, mode='r', offset=HEADER_SIZE * 8,
+            shape=(len(FACTORS), self.count, self.max_n + 1),
+        )
+        self.rows = dict(zip(FACTORS, self.values))
+
+    def lookup(self, factor, i, n):
+        """
+        Return the ``factor`` ('P/A', 'A/G', ...) for rate ``i`` percent and ``n`` periods.
+
+        Rates inside the table are interpolated linearly between the two nearest
+        tabulated rates (exact on the grid). Rates outside the table and
+        non-integer or too large ``n`` are computed directly instead.
+        """
+        if factor not in FACTORS:
+            raise ValueError(f"Unknown factor '{factor}'. Available: {', '.join(FACTORS)}")
+
+        if isinstance(i, (int, float)) and isinstance(n, int):
+            position = (i - self.first_rate) / self.step
+            if 0 <= position <= self.count - 1 and 0 <= n <= self.max_n:
+                table = self.rows[factor]
+                lower = min(int(position), self.count - 2)
+                weight = position - lower
+                return (1 - weight) * table[lower, n] + weight * table[lower + 1, n]
+
+        i, n = np.broadcast_arrays(np.asarray(i, dtype=float), np.asarray(n, dtype=float))
+        position = (i - self.first_rate) / self.step
+        inside = (position >= 0) & (position <= self.count - 1) & (n >= 0) & (n <= self.max_n) & (n == np.floor(n))
+
+        table = self.rows[factor]
+        result = np.empty(i.shape)
+
+        position, periods = position[inside], n[inside].astype(np.intp)
+        lower = np.minimum(np.floor(position).astype(np.intp), self.count - 2)
+        weight = position - lower
+        result[inside] = (1 - weight) * table[lower, periods] + weight * table[lower + 1, periods]
+
+        outside = ~inside
+        if outside.any():
+            result[outside] = FACTORS[factor](i[outside], n[outside])
+
+        return result[()] if result.ndim == 0 else result
+
+
+if __name__ == '__main__':
+    import os
+    from tempfile import TemporaryDirectory
+    from time import perf_counter
+
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'interest.f64')
+
+        start = perf_counter()
+        build_table(path)
+        print(f"build: {(perf_counter() - start) * 1000:.1f} ms, {os.path.getsize(path) / 1e6:.2f} MB")
+
+        start = perf_counter()
+        table = InterestTable(path)
+        print(f"open: {(perf_counter() - start) * 1e6:.0f} us")
+
+        print(table.lookup('P/G', 5, 5), P_G_factor(5, 5))
+        print(table.lookup('P/A', 7.1, 30), P_A_factor(7.1, 30))
+        print(table.lookup('P/A', 40, 30), P_A_factor(40, 30))
+
+        generator = np.random.default_rng(0)
+        rates = generator.integers(1, 101, 1_000_000) * 0.25
+        periods = generator.integers(0, 401, 1_000_000)
+        for label, compute in (
+            ('table lookup', lambda: table.lookup('P/G', rates, periods)),
+            ('direct', lambda: P_G_factor(rates, periods)),
+        ):
+            start = perf_counter()
+            compute()
+            print(f"{label:12} 1M values: {(perf_counter() - start) * 1000:.0f} ms")
+
+        pairs = list(zip(rates[:10_000].tolist(), periods[:10_000].tolist()))
+        for label, compute in (
+            ('table lookup', lambda: [table.lookup('P/G', i, n) for i, n in pairs]),
+            ('direct', lambda: [P_G_factor(i, n) for i, n in pairs]),
+        ):
+            start = perf_counter()
+            compute()
+            print(f"{label:12} 10k scalar calls: {(perf_counter() - start) * 1000:.0f} ms")
+        assert np.allclose(table.lookup('P/G', rates, periods), P_G_factor(rates, periods))
+        del table
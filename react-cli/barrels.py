@@ -0,0 +1,93 @@
+"""
+# SPDX-License-Identifier: MIT
+# © 2025 Christ Bouka <christbouka14@yahoo.fr>
+#
+# Signed-off-by: Christ Bouka <christbouka14@yahoo.fr>
+
+Barrel (index.ts) maintenance for the React CLI Generator.
+
+Each barrel is parsed once into an index of its export lines. New exports are queued and every changed barrel
+is rewritten once per run, however many schematics were added to it.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+BARREL_NAMES = ('index.ts', 'index.tsx')
+
+# Export line per type; other types re-export every named export of the main file
+BARREL_EXPORTS = {
+    'component': "export {{ default as {name} }} from '{module}';",
+    'redux': "export {{ default as {camelName}Reducer }} from '{module}';",
+}
+DEFAULT_EXPORT = "export * from '{module}';"
+
+
+def export_line(type: str, name: str, camel_name: str, barrel_path: Path, main_file: Path, extension: str) -> str:
+    """Export statement that re-exports the main file of a schematic from a barrel."""
+    module = os.path.relpath(str(main_file)[:-len(extension)], barrel_path.parent).replace(os.sep, '/')
+    if not module.startswith('.'):
+        module = './' + module
+    return BARREL_EXPORTS.get(type, DEFAULT_EXPORT).format(name=name, camelName=camel_name, module=module)
+
+
+class BarrelIndex:
+    """
+    Cached export index of the barrel files of a sink, invalidated when a barrel's signature (mtime and size
+    on disk) changes.
+    """
+
+    def __init__(self, sink):
+        self.sink = sink
+        # barrel path -> (signature, content, export lines)
+        self._barrels: dict[Path, tuple[tuple, str, set[str]]] = {}
+        self._pending: dict[Path, list[str]] = {}
+
+    def _load(self, barrel_path: Path) -> tuple[str, set[str]]:
+        signature = self.sink.signature(barrel_path)
+        if signature is None:
+            return '', set()
+        cached = self._barrels.get(barrel_path)
+        if cached and cached[0] == signature:
+            return cached[1], cached[2]
+        content = self.sink.read_text(barrel_path)
+        exports = {line.strip() for line in content.splitlines() if line.startswith('export')}
+        self._barrels[barrel_path] = (signature, content, exports)
+        return content, exports
+
+    def add(self, barrel_path: Path, line: str) -> bool:
+        """Queue an export line unless the barrel already has it. Returns True if it was queued."""
+        _, exports = self._load(barrel_path)
+        pending = self._pending.setdefault(barrel_path, [])
+        if line in exports or line in pending:
+            return False
+        pending.append(line)
+        return True
+
+    def is_pending(self, barrel_path: Path) -> bool:
+        """Whether exports are queued for barrel_path, which is then created or updated by this run."""
+        return bool(self._pending.get(barrel_path))
+
+    def pending_files(self) -> list[tuple[Path, str]]:
+        """New content of every barrel with queued exports, appended after the existing exports."""
+        files = []
+        for barrel_path, lines in self._pending.items():
+            if not lines:
+                continue
+            content, _ = self._load(barrel_path)
+            if content and not content.endswith('\n'):
+                content += '\n'
+            files.append((barrel_path, content + ''.join(line + '\n' for line in lines)))
+        return files
+
+    def mark_written(self, files: list[tuple[Path, str]]) -> None:
+        """Update the index with the barrels that were just written and clear the queue."""
+        for barrel_path, content in files:
+            exports = {line.strip() for line in content.splitlines() if line.startswith('export')}
+            self._barrels[barrel_path] = (self.sink.signature(barrel_path), content, exports)
+        self._pending.clear()
+
+    def discard_pending(self) -> None:
+        self._pending.clear()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the React CLI Generator.
+
+Usage:
+    python bench.py templates [--iterations N]
+    python bench.py startup [--iterations N] [--budget-ms MS]
+    python bench.py generate [--sizes 1,100,10000] [--types component,hook] [--sink disk|memory] [--json FILE]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+from generator import CompiledTemplate, ReactCLIGenerator
+from sinks import MemorySink
+from templates import TEMPLATES
+
+CLI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cli.py')
+
+# Import time budget for `cli.py --help`, on top of the interpreter's own startup imports.
+# argparse and its dependencies account for most of it.
+STARTUP_BUDGET_MS = 25.0
+
+GENERATE_SIZES = (1, 100, 10000)
+
+
+def scratch_dir() -> str:
+    """Directory for generated benchmark files: tmpfs when available so the disk does not dominate."""
+    return '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+
+def bench_templates(iterations: int) -> None:
+    """Compare rendering every TEMPLATES entry with str.format against the compiled templates."""
+    values = {'name': 'UserProfile', 'pascalName': 'UserProfile', 'camelName': 'userProfile'}
+    raw_templates = [file_config['template'] for config in TEMPLATES.values() for file_config in config['files']]
+    compiled_templates = [CompiledTemplate(template) for template in raw_templates]
+
+    # Both paths must produce the exact same output
+    for raw, compiled in zip(raw_templates, compiled_templates):
+        assert raw.format(**values) == compiled.render(**values)
+
+    format_time = timeit.timeit(lambda: [t.format(**values) for t in raw_templates], number=iterations)
+    render_time = timeit.timeit(lambda: [t.render(**values) for t in compiled_templates], number=iterations)
+    compile_time = timeit.timeit(lambda: [CompiledTemplate(t) for t in raw_templates], number=1)
+
+    files = iterations * len(raw_templates)
+    print(f"Rendered {files} files ({len(raw_templates)} templates x {iterations})")
+    print(f"  str.format        : {format_time:.4f}s ({format_time / files * 1e6:.2f} µs/file)")
+    print(f"  CompiledTemplate  : {render_time:.4f}s ({render_time / files * 1e6:.2f} µs/file)")
+    print(f"  one-time compile  : {compile_time * 1e3:.3f} ms")
+    print(f"  speedup           : {format_time / render_time:.2f}x")
+
+
+def measure_import_time(args: list, cwd: str = None) -> tuple:
+    """
+    Run cli.py under `python -X importtime` and return (total import time in ms, slowest imports).
+    Modules the bare interpreter imports anyway are excluded, so only the cost of cli.py is counted.
+    """
+    def run(command: list) -> dict:
+        result = subprocess.run([sys.executable, '-X', 'importtime'] + command,
+                                capture_output=True, text=True, cwd=cwd)
+        imports = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, _, name = line[len('import time:'):].split('|')
+            imports[name.strip()] = int(self_us)
+        return imports
+
+    baseline = run(['-c', 'pass'])
+    imports = {name: us for name, us in run([CLI_PATH] + args).items() if name not in baseline}
+    slowest = sorted(imports.items(), key=lambda item: item[1], reverse=True)[:5]
+    return sum(imports.values()) / 1000, slowest
+
+
+def bench_startup(iterations: int, budget_ms: float) -> bool:
+    """Measure the import cost of `cli.py --help` and check it against the startup budget."""
+    runs = [measure_import_time(['--help']) for _ in range(iterations)]
+    best_ms, slowest = min(runs, key=lambda run: run[0])
+
+    print(f"cli.py --help import time (best of {iterations}): {best_ms:.2f} ms (budget {budget_ms:.2f} ms)")
+    for name, us in slowest:
+        print(f"  {name:<30} {us / 1000:.2f} ms")
+
+    with tempfile.TemporaryDirectory() as project_dir:
+        generate_ms, _ = min((measure_import_time(['react', 'g', 'c', 'Bench', '--skip-existing'], cwd=project_dir)
+                              for _ in range(iterations)), key=lambda run: run[0])
+    print(f"cli.py react g c import time (informational): {generate_ms:.2f} ms")
+
+    within_budget = best_ms <= budget_ms
+    print('OK' if within_budget else 'FAIL: startup import time is over budget')
+    return within_budget
+
+
+def bench_generate(sizes: list, types: list, sink: str = 'disk') -> list:
+    """
+    Generate `size` schematics of each type into a scratch directory (or a MemorySink) through
+    ReactCLIGenerator.generate (a single schematic) or generate_batch, and return one result per run with
+    the per-phase timings.
+    """
+    results = []
+    for type in types:
+        for size in sizes:
+            with tempfile.TemporaryDirectory(dir=scratch_dir()) as project_dir:
+                generator = ReactCLIGenerator(os.path.join(project_dir, 'src'),
+                                              sink=MemorySink() if sink == 'memory' else None)
+                timer = generator.enable_profiling()
+                if size == 1:
+                    ok = generator.generate(type, 'bench', 'Bench0')
+                else:
+                    ok = generator.generate_batch([(type, f'bench/Bench{i}') for i in range(size)])
+                report = timer.report()
+            files = size * len(generator.get_templates(type))
+            results.append({'type': type, 'sink': sink, 'schematics': size, 'files': files, 'ok': ok, **report})
+            print(f"{type:<10} {size:>6} schematics {files:>7} files  {report['total_seconds']:8.3f}s  "
+                  f"{files / report['total_seconds']:10.0f} files/s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='React CLI Generator benchmarks')
+    parser.add_argument('suite', choices=['templates', 'startup', 'generate'], help='Benchmark to run.')
+    parser.add_argument('--iterations', type=int, help='Number of renders per template, or of startup runs.')
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS,
+                        help='Startup import time budget; the startup suite exits with 1 when it is exceeded.')
+    parser.add_argument('--sizes', default=','.join(map(str, GENERATE_SIZES)),
+                        help='Comma-separated numbers of schematics for the generate suite.')
+    parser.add_argument('--types', default=','.join(TEMPLATES), help='Comma-separated types for the generate suite.')
+    parser.add_argument('--sink', choices=['disk', 'memory'], default='disk',
+                        help='Where the generate suite writes its files.')
+    parser.add_argument('--json', metavar='FILE', help='Also write the generate results as JSON to FILE.')
+    args = parser.parse_args()
+
+    if args.suite == 'templates':
+        bench_templates(args.iterations or 10000)
+    elif args.suite == 'startup':
+        sys.exit(0 if bench_startup(args.iterations or 5, args.budget_ms) else 1)
+    elif args.suite == 'generate':
+        results = bench_generate([int(size) for size in args.sizes.split(',')], args.types.split(','), args.sink)
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+# SPDX-License-Identifier: MIT
+# © 2025 Christ Bouka <christbouka14@yahoo.fr>
+#
+# Signed-off-by: Christ Bouka <christbouka14@yahoo.fr>
+
+Thin client for the React CLI Generator daemon (`cli.py react serve`).
+Only `os` is imported at module level so that checking for a daemon costs almost nothing.
+"""
+
+import os
+
+
+def default_socket_path() -> str:
+    """
+    Socket used by the daemon: $REACT_CLI_SOCKET, or a per-user socket in $XDG_RUNTIME_DIR (private to the
+    user) or, failing that, in the temp directory.
+    """
+    path = os.environ.get('REACT_CLI_SOCKET')
+    if path:
+        return path
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, 'react-cli.sock')
+    user = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    return os.path.join(os.environ.get('TMPDIR', '/tmp'), f'react-cli-{user}.sock')
+
+
+def daemon_available(socket_path: str) -> bool:
+    """
+    Whether a daemon socket exists at socket_path and belongs to the current user. In a shared temp directory
+    anyone could create the socket, and requests must not be sent to another user's process.
+    """
+    import stat
+
+    try:
+        info = os.lstat(socket_path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and (not hasattr(os, 'getuid') or info.st_uid == os.getuid())
+
+
+def send_request(request: dict, socket_path: str, timeout: float = 30.0):
+    """
+    Send one JSON request to the daemon and return its decoded response.
+    Returns None only when no daemon accepts the connection, so callers can fall back to in-process generation.
+    Once the request is sent the daemon may already be writing files, so a missing, truncated or invalid
+    response gives a failed response ({'ok': False, 'output': ...}) instead of None.
+    """
+    import json
+    import socket
+
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(socket_path)
+        except (OSError, socket.timeout):
+            # Stale socket file, daemon not running, or the connection timed out
+            return None
+        try:
+            sock.sendall(json.dumps(request).encode() + b'\n')
+            with sock.makefile('rb') as response:
+                line = response.readline()
+        except (OSError, socket.timeout) as e:
+            return _failed(f"No response from the daemon on {socket_path}: {e or type(e).__name__}")
+
+    if not line.endswith(b'\n'):
+        return _failed(f"The daemon on {socket_path} closed the connection before answering")
+    try:
+        response = json.loads(line)
+    except ValueError:
+        response = None
+    if not isinstance(response, dict) or 'output' not in response or 'ok' not in response:
+        return _failed(f"Invalid response from the daemon on {socket_path}")
+    return response
+
+
+def _failed(message: str) -> dict:
+    # The request may have been (partly) carried out: report it rather than generating again in-process
+    return {'ok': False, 'output': f"✗ {message}. Files may have been written; check them before retrying "
+                                   f"(or pass --no-daemon).\n"}
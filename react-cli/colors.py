@@ -0,0 +1,31 @@
+"""
+# SPDX-License-Identifier: MIT
+# © 2025 Christ Bouka <christbouka14@yahoo.fr>
+#
+# Signed-off-by: Christ Bouka <christbouka14@yahoo.fr>
+
+Terminal colors shared by the React CLI Generator modules.
+"""
+
+
+# ANSI color codes for terminal output
+class Colors:
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+
+    # Every code by name (GREEN, RED...), filled in below from the attributes above
+    CODES = {}
+
+    @classmethod
+    def set_enabled(cls, enabled: bool) -> None:
+        """Turn the codes on or off, e.g. when the output is not a terminal."""
+        for name, code in cls.CODES.items():
+            setattr(cls, name, code if enabled else '')
+
+
+# Taken before set_enabled() can blank the attributes, so that it can always restore them
+Colors.CODES.update((name, code) for name, code in vars(Colors).items() if name.isupper() and name != 'CODES')
@@ -0,0 +1,201 @@
+"""
+# SPDX-License-Identifier: MIT
+# © 2025 Christ Bouka <christbouka14@yahoo.fr>
+#
+# Signed-off-by: Christ Bouka <christbouka14@yahoo.fr>
+
+Feature scaffolding for the React CLI Generator (`cli.py react g feature todo.yaml`).
+
+A feature spec lists related schematics under a common path. Each schematic may import others by name:
+
+    path: features/todo
+    schematics:
+      - {type: redux, name: todo}
+      - {type: service, name: todoApi}
+      - {type: hook, name: todos, imports: [todoApi, todo]}
+      - {type: component, name: TodoList, path: components, imports: [todos]}
+
+Schematics are ordered so that every schematic comes after the ones it imports, the import statements are
+resolved to relative paths and added to the main file of each importer, and the whole feature is written
+in a single transaction.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+from generator import ReactCLIGenerator, TYPE_ALIASES, NAME_ERRORS, read_structured_file
+
+# How a schematic is imported by another one, depending on what its main file exports
+IMPORT_STATEMENTS = {
+    'component': "import {name} from '{module}';",
+    'service': "import {camelName}Service from '{module}';",
+    'hook': "import {{ {name} }} from '{module}';",
+    'redux': "import {camelName}Reducer from '{module}';",
+    'context': "import {{ {name}Provider, use{pascalName} }} from '{module}';",
+}
+DEFAULT_IMPORT = "import * as {pascalName} from '{module}';"
+
+# 'use client', "use strict"...: directives must stay the first statements of a file
+DIRECTIVE = re.compile(r"""^(['"])use [\w ]+\1;?$""")
+IMPORT_START = re.compile(r'^import\b')
+# The line that completes an import: `... from 'module'`, `import 'module'` or anything ending with ';'
+IMPORT_END = re.compile(r"""(;|\bfrom\s*(['"]).*\2|^import\s*(['"]).*\3)\s*(//.*)?$""")
+
+
+class FeatureSchematic:
+    def __init__(self, type: str, path: str, name: str, imports: list[str]):
+        self.type = type
+        self.path = path
+        self.name = name
+        self.imports = imports
+        self.files: list[tuple[Path, str]] = []
+        self.module_path = ''
+
+    @property
+    def schematic(self) -> tuple[str, str, str]:
+        return self.type, self.path, self.name
+
+
+def load_feature_spec(source: str) -> dict:
+    spec = read_structured_file(source)
+    if not isinstance(spec, dict) or not isinstance(spec.get('schematics'), list):
+        raise ValueError("A feature spec must be a mapping with a 'schematics' list")
+    return spec
+
+
+def order_schematics(schematics: list[FeatureSchematic], references: dict[str, FeatureSchematic]) -> list:
+    """
+    Order schematics so that each one comes after the schematics it imports, keeping the spec order otherwise.
+    Raises ValueError for unknown references and import cycles.
+    """
+    dependencies = {}
+    for schematic in schematics:
+        dependencies[schematic] = []
+        for reference in schematic.imports:
+            if reference not in references:
+                raise ValueError(f"'{schematic.name}' imports unknown schematic '{reference}'")
+            dependencies[schematic].append(references[reference])
+
+    ordered = []
+    state = {}  # schematic -> 'visiting' or 'done'
+
+    def visit(schematic: FeatureSchematic, chain: list) -> None:
+        if state.get(schematic) == 'done':
+            return
+        if state.get(schematic) == 'visiting':
+            cycle = ' -> '.join(item.name for item in chain[chain.index(schematic):] + [schematic])
+            raise ValueError(f"Import cycle: {cycle}")
+        state[schematic] = 'visiting'
+        for dependency in dependencies[schematic]:
+            visit(dependency, chain + [schematic])
+        state[schematic] = 'done'
+        ordered.append(schematic)
+
+    for schematic in schematics:
+        visit(schematic, [])
+    return ordered
+
+
+def import_statement(generator: ReactCLIGenerator, importer: FeatureSchematic, imported: FeatureSchematic) -> str:
+    formatted_name, pascal_name, camel_name = generator.format_name(imported.name, imported.type)
+    module = os.path.relpath(imported.module_path, importer.files[0][0].parent).replace(os.sep, '/')
+    if not module.startswith('.'):
+        module = './' + module
+    return IMPORT_STATEMENTS.get(imported.type, DEFAULT_IMPORT).format(
+        name=formatted_name, pascalName=pascal_name, camelName=camel_name, module=module)
+
+
+def inject_imports(content: str, statements: list[str]) -> str:
+    """
+    Insert import statements after the leading imports of a file, or after its directives ('use client') when
+    it has none. An import runs until the line that completes it, so multi-line imports are never split.
+    """
+    lines = content.splitlines(True)
+    insert_at = 0
+    in_import = in_comment = False
+    for position, line in enumerate(lines):
+        text = line.strip()
+        if in_import:
+            if IMPORT_END.search(text):
+                in_import = False
+                insert_at = position + 1
+        elif in_comment:
+            in_comment = '*/' not in text
+        elif IMPORT_START.match(text):
+            if IMPORT_END.search(text):
+                insert_at = position + 1
+            else:
+                in_import = True
+        elif DIRECTIVE.match(text):
+            insert_at = position + 1
+        elif text.startswith('/*'):
+            in_comment = '*/' not in text
+        elif text and not text.startswith('//'):
+            break
+    return ''.join(lines[:insert_at] + [statement + '\n' for statement in statements] + lines[insert_at:])
+
+
+def generate_feature(generator: ReactCLIGenerator, spec: dict, path: str | None = None, workers: int | None = None,
+                     on_existing: str = 'error', barrel: bool = False) -> bool:
+    """Plan, link and write every schematic of a feature spec in one pass."""
+    base_path = path if path is not None else spec.get('path', '')
+    errors = []
+    schematics = []
+    references = {}
+    ambiguous: dict[str, list[FeatureSchematic]] = {}
+
+    for item in spec['schematics']:
+        type = TYPE_ALIASES.get(item['type'], item['type'])
+        item_path = '/'.join(part.strip('/') for part in (base_path, item.get('path', '')) if part)
+        schematic = FeatureSchematic(type, item_path, item['name'], list(item.get('imports', [])))
+        template_error = generator.template_error(type)
+        if template_error is not None:
+            errors.append(f"{template_error} ({type} '{schematic.name}')")
+            continue
+        files = generator.plan(type, item_path, schematic.name, verbose=False)
+        if files is None:
+            reason = NAME_ERRORS.get(type, 'Unknown type or invalid name.')
+            errors.append(f"Invalid {type} '{schematic.name}': {reason}")
+            continue
+        schematic.files = files
+        main_file, extension = files[0][0], generator.get_templates(type)[0][0]
+        schematic.module_path = str(main_file)[:-len(extension)]
+        schematics.append(schematic)
+        # Schematics can be referenced by the name used in the spec or by their generated name
+        for reference in (schematic.name, generator.format_name(schematic.name, type)[0]):
+            other = references.setdefault(reference, schematic)
+            if other is not schematic and schematic not in ambiguous.setdefault(reference, [other]):
+                ambiguous[reference].append(schematic)
+
+    for schematic in schematics:
+        for reference in dict.fromkeys(schematic.imports):
+            if reference in ambiguous:
+                candidates = ', '.join(f"{other.type} '{other.name}'" for other in ambiguous[reference])
+                errors.append(f"'{schematic.name}' imports '{reference}', which names several schematics: "
+                              f"{candidates}")
+
+    try:
+        ordered = order_schematics(schematics, references)
+    except ValueError as e:
+        errors.append(str(e))
+        ordered = []
+
+    # Recorded in the generated-files manifest, so that `react update` re-applies them
+    imports = {}
+    with generator.timer('render'):
+        for schematic in ordered:
+            if schematic.imports:
+                statements = [import_statement(generator, schematic, references[reference])
+                              for reference in dict.fromkeys(schematic.imports)]
+                main_file, content = schematic.files[0]
+                schematic.files[0] = (main_file, inject_imports(content, statements))
+                imports[main_file] = statements
+
+    if errors:
+        generator.write_schematics([], errors, 'Feature')
+        return False
+    return generator.write_schematics([(schematic.schematic, schematic.files) for schematic in ordered], errors,
+                                      'Feature', workers, on_existing, barrel, imports)
@@ -0,0 +1,185 @@
+"""
+# SPDX-License-Identifier: MIT
+# © 2025 Christ Bouka <christbouka14@yahoo.fr>
+#
+# Signed-off-by: Christ Bouka <christbouka14@yahoo.fr>
+
+Manifest of the files written by the React CLI Generator, stored in .react-cli/generated.json.
+
+For every generated file it records the schematic it came from, the hash of the template and of the output,
+and the file's mtime and size. `cli.py react update` uses it to re-apply changed templates to files that
+nobody has edited since, without reading files whose recorded mtime and size still match.
+
+Generating does not rewrite the manifest: new records are appended to a journal (.react-cli/generated.log,
+one JSON object per line) in a single write, and the journal is folded into generated.json once it grows
+larger than it. Appends and compactions hold an exclusive flock on .react-cli/generated.lock, so
+concurrent CLI runs and daemon requests never lose each other's records.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+MANIFEST_FILE = os.path.join('.react-cli', 'generated.json')
+JOURNAL_FILE = os.path.join('.react-cli', 'generated.log')
+LOCK_FILE = os.path.join('.react-cli', 'generated.lock')
+MANIFEST_VERSION = 1
+
+# The journal is compacted into the manifest once it is larger than both this and the manifest itself, so
+# that compaction costs stay proportional to the records appended since the last one
+COMPACT_MIN_BYTES = 1 << 20
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class GeneratedManifest:
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.path = self.root / MANIFEST_FILE
+        self.journal_path = self.root / JOURNAL_FILE
+        self.lock_path = self.root / LOCK_FILE
+        self._entries: dict[str, dict] | None = None
+        # Records not saved yet, appended to the journal by save()
+        self._pending: dict[str, dict] = {}
+
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """Hold a flock on the lock file (a no-op where fcntl is not available)."""
+        try:
+            import fcntl
+        except ImportError:
+            yield
+            return
+        if not exclusive and not self.lock_path.parent.is_dir():
+            # Nothing was ever recorded: there is nothing to read either
+            yield
+            return
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+
+    def _read(self) -> dict[str, dict]:
+        """Entries on disk: the manifest with the journal records applied in order. Call with the lock held."""
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            data = {}
+        entries = data.get('files', {}) if data.get('version') == MANIFEST_VERSION else {}
+        try:
+            with open(self.journal_path, encoding='utf-8') as journal:
+                for line in journal:
+                    try:
+                        record = json.loads(line)
+                        entries[record['key']] = record['entry']
+                    except (ValueError, KeyError, TypeError):
+                        # A line cut short by a crash
+                        continue
+        except FileNotFoundError:
+            pass
+        return entries
+
+    @property
+    def entries(self) -> dict[str, dict]:
+        """Entries keyed on the file path relative to the project root, loaded on first access."""
+        if self._entries is None:
+            with self._locked(exclusive=False):
+                self._entries = self._read()
+            self._entries.update(self._pending)
+        return self._entries
+
+    def refresh(self) -> None:
+        """Forget the loaded entries, to see the records saved by other processes on the next access."""
+        self._entries = None
+
+    def key(self, file_path: Path) -> str:
+        return os.path.relpath(file_path, self.root).replace(os.sep, '/')
+
+    def file_path(self, key: str) -> Path:
+        return self.root / key
+
+    def record(self, file_path: Path, schematic: tuple[str, str, str], template_hash: str, output_hash: str,
+               imports: list[str] | None = None) -> None:
+        """
+        Record a file that was just written with the given output. Saved by save().
+        imports are the statements added to the rendered template (see feature.py), re-applied by update.
+        """
+        stat = os.stat(file_path)
+        type, path, name = schematic
+        entry = {
+            'type': type,
+            'path': path,
+            'name': name,
+            'template_hash': template_hash,
+            'output_hash': output_hash,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+        }
+        if imports:
+            entry['imports'] = list(imports)
+        key = self.key(file_path)
+        self._pending[key] = entry
+        if self._entries is not None:
+            self._entries[key] = entry
+
+    def touch(self, key: str) -> None:
+        """Mark an entry changed in place (e.g. a refreshed template hash) to be saved by save()."""
+        self._pending[key] = self.entries[key]
+
+    def is_untouched(self, key: str) -> bool | None:
+        """
+        Whether a recorded file still holds the generated output, or None if it no longer exists.
+        The file is only read and hashed when its mtime or size differ from the recorded ones.
+        """
+        entry = self.entries[key]
+        try:
+            stat = os.stat(self.file_path(key))
+        except FileNotFoundError:
+            return None
+        if stat.st_mtime_ns == entry['mtime_ns'] and stat.st_size == entry['size']:
+            return True
+        with open(self.file_path(key), encoding='utf-8', newline='') as f:
+            untouched = content_hash(f.read()) == entry['output_hash']
+        if untouched:
+            # Touched but identical: refresh the stat so the next run skips the read
+            entry['mtime_ns'] = stat.st_mtime_ns
+            entry['size'] = stat.st_size
+            self.touch(key)
+        return untouched
+
+    def save(self) -> None:
+        """Append the pending records to the journal in one write, compacting it when it has grown too large."""
+        if not self._pending:
+            return
+        lines = ''.join(json.dumps({'key': key, 'entry': entry}, sort_keys=True) + '\n'
+                        for key, entry in self._pending.items())
+        with self._locked(exclusive=True):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, 'a', encoding='utf-8') as journal:
+                journal.write(lines)
+                journal_size = journal.tell()
+            try:
+                manifest_size = os.path.getsize(self.path)
+            except FileNotFoundError:
+                manifest_size = 0
+            if journal_size > max(COMPACT_MIN_BYTES, manifest_size):
+                self._compact()
+        self._pending.clear()
+
+    def _compact(self) -> None:
+        """Fold the journal into the manifest. Call with the exclusive lock held."""
+        entries = self._read()
+        temp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'files': entries}, f, indent=1, sort_keys=True)
+        os.replace(temp_path, self.path)
+        # Readers hold the lock too, so none of them sees the new manifest with the old journal
+        open(self.journal_path, 'w').close()
+        if self._entries is not None:
+            self._entries = entries
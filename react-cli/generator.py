@@ -0,0 +1,812 @@
+"""
+# SPDX-License-Identifier: MIT
+# © 2025 Christ Bouka <christbouka14@yahoo.fr>
+#
+# Signed-off-by: Christ Bouka <christbouka14@yahoo.fr>
+
+Core of the React CLI Generator: name formatting, template rendering and writing through output sinks.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import re
+import string
+import time
+from collections import namedtuple
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+
+from reporter import Reporter
+from sinks import DiskSink
+from templates import TEMPLATES
+
+
+TYPE_ALIASES = {
+    'c': 'component',
+    's': 'service',
+    'h': 'hook',
+    'r': 'redux',
+    'ctx': 'context'
+}
+
+NAME_ERRORS = {
+    'hook': "Hook name must start with 'use' (e.g., useCounter)",
+    'redux': "Redux slice name must be camelCase (e.g., myCounter)",
+    'component': "Component name must be PascalCase (e.g., MyComponent)",
+    'service': "Service name must be PascalCase (e.g., DataService)",
+    'context': "Context name must be PascalCase (e.g., UserContext)",
+}
+
+
+# Slots the templates can use, filled by ReactCLIGenerator.plan
+TEMPLATE_SLOTS = ('name', 'pascalName', 'camelName', 'kebabName', 'snakeName', 'constantName')
+
+# Threads used to stage the files of a batch when no worker count is given (the ThreadPoolExecutor default)
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+NameCasings = namedtuple('NameCasings', ['pascal', 'camel', 'kebab', 'snake', 'constant'])
+
+
+def split_words(name: str) -> list[str]:
+    """
+    Split a camelCase, PascalCase, kebab-case or snake_case name into words in a single pass.
+
+    Any character that is not a letter or a digit separates words, an uppercase letter after a lowercase
+    letter or a digit starts a new word, and an acronym ends before its last capital ('HTTPClient' -> HTTP, Client).
+    """
+    words = []
+    current = []
+    previous = ''  # 'upper', 'lower', 'digit' or '' at a word boundary
+
+    for char in name:
+        if char.isupper():
+            if previous in ('lower', 'digit'):
+                words.append(''.join(current))
+                current = []
+            previous = 'upper'
+        elif char.islower():
+            if previous == 'upper' and len(current) > 1:
+                last = current.pop()
+                words.append(''.join(current))
+                current = [last]
+            previous = 'lower'
+        elif char.isdigit():
+            previous = 'digit'
+        else:
+            if current:
+                words.append(''.join(current))
+                current = []
+            previous = ''
+            continue
+        current.append(char)
+
+    if current:
+        words.append(''.join(current))
+    return words
+
+
+@lru_cache(maxsize=4096)
+def name_casings(name: str) -> NameCasings:
+    """Return every casing of a name, computed from one tokenization."""
+    words = split_words(name)
+    lower_words = [word.lower() for word in words]
+    pascal = ''.join(word[0].upper() + word[1:] for word in lower_words)
+    return NameCasings(
+        pascal=pascal,
+        camel=pascal[:1].lower() + pascal[1:],
+        kebab='-'.join(lower_words),
+        snake='_'.join(lower_words),
+        constant='_'.join(lower_words).upper(),
+    )
+
+
+@lru_cache(maxsize=4096)
+def format_name(name: str, type: str) -> tuple[str, str, str]:
+    """Formats name and returns a tuple of (formatted_name, pascal_case_base, camel_case_base)."""
+    base_name = name
+
+    # Strip common suffixes/prefixes if user included them, to avoid duplication
+    if type == 'service' and base_name.lower().endswith('service'):
+        base_name = base_name[:-7]
+    if type == 'hook' and base_name.lower().startswith('use'):
+        base_name = base_name[3:]
+    if type == 'redux' and base_name.lower().endswith('slice'):
+        base_name = base_name[:-5]
+    if type == 'context' and base_name.lower().endswith('context'):
+        base_name = base_name[:-7]
+
+    casings = name_casings(base_name)
+    pascal_case = casings.pascal
+    camel_case = casings.camel
+
+    if type == 'hook':
+        formatted_name = 'use' + pascal_case
+    elif type == 'service':
+        formatted_name = pascal_case + 'Service'
+    elif type == 'redux':
+        formatted_name = camel_case + 'Slice'
+    elif type == 'context':
+        formatted_name = pascal_case + 'Context'
+    else:  # component
+        formatted_name = pascal_case
+
+    return formatted_name, pascal_case, camel_case
+
+
+class CompiledTemplate:
+    """A template parsed once into literal chunks and the indices of the slots to fill between them."""
+
+    def __init__(self, template: str):
+        self.parts: list[str] = []
+        self.slots: list[tuple[int, str]] = []
+        # Formatter.parse resolves the '{{' / '}}' escapes, so literal chunks are stored unescaped
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+            if literal:
+                self.parts.append(literal)
+            if field_name is not None:
+                if format_spec or conversion:
+                    raise ValueError(f"Unsupported format spec in template field '{field_name}'")
+                self.slots.append((len(self.parts), field_name))
+                self.parts.append('')
+
+    @property
+    def digest(self) -> str:
+        """Hash of the template, computed once. Used to detect template changes between runs."""
+        digest = getattr(self, '_digest', None)
+        if digest is None:
+            import hashlib
+
+            digest = hashlib.sha256(repr((self.parts, self.slots)).encode('utf-8')).hexdigest()
+            self._digest = digest
+        return digest
+
+    @classmethod
+    def from_parts(cls, parts: list[str], slots: list[tuple[int, str]]) -> CompiledTemplate:
+        """Rebuild a compiled template from its literal chunks and slots, e.g. when loaded from a cache."""
+        template = cls.__new__(cls)
+        template.parts = parts
+        template.slots = slots
+        return template
+
+    def render(self, **values: str) -> str:
+        """Fill the slots with values and join the result in a single pass."""
+        parts = self.parts.copy()
+        for index, field_name in self.slots:
+            parts[index] = values[field_name]
+        return ''.join(parts)
+
+
+class CollisionIndex:
+    """
+    In-memory index of the names that already exist in target directories of a sink.
+    Each directory is listed once (os.scandir on disk) instead of calling exists() on every planned file.
+    """
+
+    def __init__(self, sink=None):
+        self.sink = sink or DiskSink()
+        self._entries: dict[Path, frozenset | None] = {}
+
+    def names(self, directory: Path) -> frozenset | None:
+        """Return the entry names of a directory, or None if it does not exist."""
+        try:
+            return self._entries[directory]
+        except KeyError:
+            pass
+        names = self.sink.names(directory)
+        self._entries[directory] = names
+        return names
+
+    def dir_exists(self, directory: Path) -> bool:
+        return self.names(directory) is not None
+
+    def exists(self, file_path: Path) -> bool:
+        names = self.names(file_path.parent)
+        return names is not None and file_path.name in names
+
+    def collisions(self, file_paths: Iterable[Path]) -> list[Path]:
+        """Return the planned paths that already exist."""
+        return [file_path for file_path in file_paths if self.exists(file_path)]
+
+
+class _TimedPhase:
+    __slots__ = ('timer', 'phase', 'start')
+
+    def __init__(self, timer: PhaseTimer, phase: str):
+        self.timer = timer
+        self.phase = phase
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        elapsed = time.perf_counter() - self.start
+        self.timer.seconds[self.phase] = self.timer.seconds.get(self.phase, 0.0) + elapsed
+        self.timer.calls[self.phase] = self.timer.calls.get(self.phase, 0) + 1
+
+
+class _UntimedPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+_UNTIMED_PHASE = _UntimedPhase()
+
+
+def no_timer(phase: str) -> _UntimedPhase:
+    """Timer used when profiling is off: a shared no-op context manager."""
+    return _UNTIMED_PHASE
+
+
+class PhaseTimer:
+    """Accumulates the wall time and number of calls of each generation phase (see --profile)."""
+
+    def __init__(self):
+        self.seconds: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+        self.started = time.perf_counter()
+
+    def __call__(self, phase: str) -> _TimedPhase:
+        return _TimedPhase(self, phase)
+
+    def report(self) -> dict:
+        return {
+            'total_seconds': time.perf_counter() - self.started,
+            'phases': {phase: {'seconds': seconds, 'calls': self.calls[phase]}
+                       for phase, seconds in self.seconds.items()},
+        }
+
+
+class ReactCLIGenerator:
+    """
+    Generates schematics under src_path. Files are written to the project through a DiskSink unless another
+    sink is given (see sinks.py), and messages are buffered in the reporter, so the generator can be used as
+    a library: every method returns its result instead of exiting.
+    """
+
+    def __init__(self, src_path: str | Path = 'src', sink=None, reporter: Reporter | None = None):
+        from template_packs import TemplatePack
+
+        self.src_path = Path(src_path)
+        self.sink = sink or DiskSink()
+        self._compiled_templates: dict[str, list[tuple[str, CompiledTemplate]]] = {}
+        # Project templates from .react-cli/templates override the built-in TEMPLATES
+        self.template_pack = TemplatePack(self.src_path.parent)
+        self._pack_templates: dict[str, list[tuple[str, CompiledTemplate]]] | None = None
+        self._generated_manifest = None
+        self._barrel_index = None
+        self.reporter = reporter or Reporter()
+        # Replaced by a PhaseTimer when profiling, see enable_profiling()
+        self.timer = no_timer
+
+    def enable_profiling(self) -> PhaseTimer:
+        """Time every generation phase from now on and return the timer holding the totals."""
+        self.timer = PhaseTimer()
+        return self.timer
+
+    def reload_templates(self) -> None:
+        """Pick up template pack changes on the next generation (only changed files are recompiled)."""
+        self._pack_templates = None
+
+    def _get_pack_templates(self) -> dict[str, list[tuple[str, CompiledTemplate]]]:
+        if self._pack_templates is None:
+            self._pack_templates = self.template_pack.load()
+        return self._pack_templates
+
+    def has_type(self, type: str) -> bool:
+        return type in TEMPLATES or type in self._get_pack_templates() or type in self.template_pack.errors
+
+    def template_error(self, type: str) -> str | None:
+        """Why the project templates of a type cannot be used, or None when they can (or there are none)."""
+        self._get_pack_templates()
+        return self.template_pack.errors.get(type)
+
+    def get_templates(self, type: str) -> list[tuple[str, CompiledTemplate]]:
+        """
+        Return the (extension, compiled template) pairs of a type, compiling them on first use.
+        The first pair is the main file: the one exported from barrels and given the imports of a feature.
+        """
+        pack_templates = self._get_pack_templates().get(type)
+        if pack_templates is not None:
+            return pack_templates
+
+        compiled = self._compiled_templates.get(type)
+        if compiled is None:
+            compiled = [(file_config['extension'], CompiledTemplate(file_config['template']))
+                        for file_config in TEMPLATES[type]['files']]
+            self._compiled_templates[type] = compiled
+        return compiled
+
+    def to_pascal_case(self, name: str) -> str:
+        """Convert any string to PascalCase."""
+        return name_casings(name).pascal
+
+    def to_camel_case(self, name: str) -> str:
+        """Convert string to camelCase."""
+        return name_casings(name).camel
+
+    def format_name(self, name: str, type: str) -> tuple[str, str, str]:
+        """Formats name and returns a tuple of (formatted_name, pascal_case_base, camel_case_base)."""
+        return format_name(name, type)
+
+    def validate_name(self, name: str, type: str) -> bool:
+        """Validate naming conventions for the final formatted name."""
+        if not name: return False
+        if type == 'hook':
+            return name.startswith('use') and len(name) > 3 and name[3].isupper()
+        if type == 'redux':
+            return bool(re.match(r'^[a-z][a-zA-Z0-9]*Slice$', name))
+        # Components, services, context must be PascalCase (with appropriate suffixes)
+        return bool(re.match(r'^[A-Z][a-zA-Z0-9]*$', name.replace('Service', '').replace('Context', '')))
+
+    def resolve_collisions(self, files: list[tuple[Path, str]], index: CollisionIndex, on_existing: str = 'error',
+                           errors: list[str] | None = None) -> list[tuple[Path, str]] | None:
+        """
+        Apply the existing-file policy to planned files before anything is written.
+        'error' reports every collision (appended to errors when given) and returns None, 'skip' drops colliding
+        files and 'overwrite' keeps them.
+        """
+        if on_existing == 'overwrite':
+            return files
+
+        collisions = index.collisions(file_path for file_path, _ in files)
+        if on_existing == 'skip':
+            existing = set(collisions)
+            return [(file_path, content) for file_path, content in files if file_path not in existing]
+
+        for file_path in collisions:
+            message = f"Error: File already exists: {self.reporter.display_path(file_path)}"
+            if errors is None:
+                self.reporter.error(message)
+            else:
+                errors.append(message)
+        return None if collisions else files
+
+    def create_files(self, files: list[tuple[Path, str]], workers: int | None = None,
+                     overwrite: bool = False, index: CollisionIndex | None = None) -> list[Path] | None:
+        """
+        Create all files in a single write transaction: either every file is written or none is.
+        Files are staged through a pool of workers threads when workers is more than 1 (batches use
+        DEFAULT_WORKERS unless told otherwise). Returns the created paths, or None on failure.
+        """
+        try:
+            with self.sink.transaction(overwrite=overwrite) as transaction:
+                for directory in dict.fromkeys(file_path.parent for file_path, _ in files):
+                    transaction.ensure_dir(directory, exists=index.dir_exists(directory) if index else None)
+                if workers is None or workers <= 1 or len(files) <= 1:
+                    for done, (file_path, content) in enumerate(files, 1):
+                        transaction.stage(file_path, content)
+                        self.reporter.progress(done, len(files))
+                else:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    with ThreadPoolExecutor(max_workers=min(workers, len(files))) as executor:
+                        for done, _ in enumerate(executor.map(lambda item: transaction.stage(*item), files), 1):
+                            self.reporter.progress(done, len(files))
+                return transaction.commit()
+        except FileExistsError as e:
+            self.reporter.error(f"Error: File already exists: {e.filename}")
+        except OSError as e:
+            self.reporter.error(f"Error creating file {e.filename}: {str(e)}")
+        return None
+
+    def plan(self, type: str, path: str, name: str, verbose: bool = True) -> list[tuple[Path, str]] | None:
+        """
+        Render every file of a schematic and return a list of (file_path, content), or None if the name is invalid.
+        """
+        if not self.has_type(type):
+            if verbose:
+                self.reporter.error(f"Error: Unknown type '{type}'")
+            return None
+        template_error = self.template_error(type)
+        if template_error is not None:
+            if verbose:
+                self.reporter.error(f"Error: {template_error}")
+            return None
+
+        original_name = name
+        with self.timer('format_name'):
+            formatted_name, pascal_name, camel_name = self.format_name(original_name, type)
+
+        # Show the formatted name if it's different from input
+        if verbose and original_name.lower() != formatted_name.lower().replace('slice', '').replace(
+                'service', '').replace('context', '').replace('use', ''):
+            self.reporter.info(f"Using formatted name: {self.reporter.style('BOLD')}{formatted_name}")
+
+        with self.timer('validate'):
+            valid = self.validate_name(formatted_name, type)
+        if not valid:
+            if verbose:
+                self.reporter.error(f"Error: Invalid name. {NAME_ERRORS.get(type, 'Name must be in PascalCase.')}")
+            return None
+
+        base_path = self.src_path / path if path else self.src_path
+
+        # For components and contexts, create a folder with the generated name
+        if type in ['component', 'context']:
+            base_path = base_path / formatted_name
+
+        planned_files = []
+        with self.timer('render'):
+            casings = name_casings(pascal_name)
+            for extension, template in self.get_templates(type):
+                # For redux, the filename *is* the formatted name
+                file_name = formatted_name + extension
+                content = template.render(
+                    name=formatted_name,
+                    pascalName=pascal_name,
+                    camelName=camel_name,
+                    kebabName=casings.kebab,
+                    snakeName=casings.snake,
+                    constantName=casings.constant,
+                )
+                planned_files.append((base_path / file_name, content))
+
+        return planned_files
+
+    def generate(self, type: str, path: str, name: str, on_existing: str = 'error', barrel: bool = False) -> bool:
+        """
+        Generate files based on type. on_existing is the policy for files that already exist (error, skip, overwrite).
+        With barrel, the schematic is also exported from the nearest index.ts.
+        """
+        planned_files = self.plan(type, path, name)
+        if planned_files is None:
+            return False
+
+        index = CollisionIndex(self.sink)
+        errors = []
+        with self.timer('collisions'):
+            files_to_write = self.resolve_collisions(planned_files, index, on_existing, errors)
+        if files_to_write is None:
+            for error in errors:
+                self.reporter.error(error)
+            self.reporter.summary(type=type, created=0, skipped=0, errors=errors)
+            return False
+
+        with self.timer('write'):
+            created_files = self.create_files(files_to_write, overwrite=on_existing == 'overwrite', index=index)
+        if created_files is None:
+            return False
+
+        with self.timer('record'):
+            self.record_generated([((type, path, name), planned_files)], created_files)
+
+        skipped = len(planned_files) - len(created_files)
+        if created_files and self.reporter.lists_files:
+            self.reporter.success(f"Successfully generated {type}:", blank_before=True)
+            for file_path in created_files:
+                self.reporter.file('CREATE', file_path)
+            self.reporter.blank()
+        elif created_files:
+            self.reporter.success(f"Successfully generated {type}: {len(created_files)} files created", summary=True)
+            for file_path in created_files:
+                self.reporter.file('CREATE', file_path)
+
+        if skipped:
+            self.reporter.warning(f"Skipped {skipped} existing file(s)", summary=not created_files)
+        self.reporter.summary(type=type, created=len(created_files), skipped=skipped, errors=[])
+
+        if barrel:
+            with self.timer('barrels'):
+                self.queue_barrel_export(type, path, name, planned_files, index)
+                barrels = self.write_barrels()
+            if barrels is None:
+                return False
+            for barrel_path in barrels:
+                self.reporter.file('UPDATE', barrel_path)
+
+        return True
+
+    def generate_batch(self, entries: Iterable[tuple[str, str]], workers: int | None = None,
+                       on_existing: str = 'error', barrel: bool = False) -> bool:
+        """Generate many (type, path_name) schematics in one run and print a single summary."""
+        planned_schematics = []
+        errors = []
+
+        # Plan every target path up front so that invalid names and duplicates are reported before writing
+        for type, path_name in entries:
+            type = TYPE_ALIASES.get(type, type)
+            if not self.has_type(type):
+                errors.append(f"Unknown type '{type}' for {path_name}")
+                continue
+            template_error = self.template_error(type)
+            if template_error is not None:
+                errors.append(f"{template_error} ({type} {path_name})")
+                continue
+            path, name = split_path_name(path_name)
+            files = self.plan(type, path, name, verbose=False)
+            if files is None:
+                reason = NAME_ERRORS.get(type, 'Name must be in PascalCase.')
+                errors.append(f"Invalid name for {type} {path_name}: {reason}")
+                continue
+            planned_schematics.append(((type, path, name), files))
+
+        return self.write_schematics(planned_schematics, errors, 'Batch', workers, on_existing, barrel)
+
+    def write_schematics(self, planned_schematics: list[tuple[tuple[str, str, str], list[tuple[Path, str]]]],
+                         errors: list[str], label: str, workers: int | None = None, on_existing: str = 'error',
+                         barrel: bool = False, imports: dict[Path, list[str]] | None = None) -> bool:
+        """
+        Write planned ((type, path, name), files) schematics in one transaction, record them, update the barrels
+        and print a single summary line followed by the planning and writing errors.
+        Nothing is written when planning reported any error (or a target collides under on_existing='error'),
+        so fixing the input and running the same command again works.
+        imports maps files to the import statements added to their rendered template (see record_generated).
+        """
+        planned_files: dict[Path, str] = {}
+        for _, files in planned_schematics:
+            for file_path, content in files:
+                if file_path in planned_files:
+                    errors.append(f"Duplicate target: {file_path}")
+                    continue
+                planned_files[file_path] = content
+
+        # Every target directory is scanned once and all collisions are reported before anything is written
+        index = CollisionIndex(self.sink)
+        with self.timer('collisions'):
+            files_to_write = self.resolve_collisions(list(planned_files.items()), index, on_existing, errors)
+        if errors:
+            files_to_write = None
+
+        # The whole batch is one transaction: a failed write leaves no partially generated schematic behind
+        created_files = None
+        if files_to_write is not None:
+            with self.timer('write'):
+                created_files = self.create_files(files_to_write,
+                                                  workers=DEFAULT_WORKERS if workers is None else workers,
+                                                  overwrite=on_existing == 'overwrite', index=index)
+        if created_files is None:
+            errors.append("No files were written")
+        else:
+            with self.timer('record'):
+                self.record_generated(planned_schematics, created_files, imports)
+
+        # All exports are queued first so that each barrel is rewritten once for the whole batch
+        barrels = []
+        if barrel and created_files is not None:
+            with self.timer('barrels'):
+                for (type, path, name), files in planned_schematics:
+                    self.queue_barrel_export(type, path, name, files, index)
+                barrels = self.write_barrels()
+            if barrels is None:
+                errors.append("Barrel files could not be updated")
+        created = len(created_files or [])
+        skipped = len(planned_files) - len(files_to_write) if files_to_write is not None else 0
+        if self.reporter.mode == 'json':
+            for file_path in created_files or []:
+                self.reporter.file('CREATE', file_path)
+        message = (f"{label} complete: {len(planned_schematics)} schematics planned, "
+                   f"{created} files created, {skipped} skipped, {len(barrels or [])} barrels updated, "
+                   f"{len(errors)} errors")
+        if errors:
+            self.reporter.warning(message, summary=True)
+        else:
+            self.reporter.success(message, summary=True)
+        for error in errors:
+            self.reporter.error(error)
+        self.reporter.summary(schematics=len(planned_schematics), created=created, skipped=skipped,
+                              barrels=len(barrels or []), errors=errors)
+
+        return not errors
+
+    @property
+    def generated_manifest(self):
+        """Manifest of generated files (.react-cli/generated.json) of the project."""
+        if self._generated_manifest is None:
+            from generated_manifest import GeneratedManifest
+
+            self._generated_manifest = GeneratedManifest(self.src_path.parent)
+        return self._generated_manifest
+
+    def record_generated(self, schematics: list[tuple[tuple[str, str, str], list[tuple[Path, str]]]],
+                         created_files: list[Path], imports: dict[Path, list[str]] | None = None) -> None:
+        """
+        Record the written files of planned (type, path, name) schematics in the generated-files manifest.
+        Files whose content is the template plus import statements (imports[file_path]) record them, so that
+        update re-renders them the same way.
+        """
+        from generated_manifest import content_hash
+
+        # The manifest describes the project on disk; files sent to another sink are not part of it
+        if not created_files or not self.sink.on_disk:
+            return
+        created = set(created_files)
+        manifest = self.generated_manifest
+        for schematic, files in schematics:
+            for (file_path, content), (_, template) in zip(files, self.get_templates(schematic[0])):
+                if file_path in created:
+                    manifest.record(file_path, schematic, template.digest, content_hash(content),
+                                    imports.get(file_path) if imports else None)
+        manifest.save()
+
+    def update(self, dry_run: bool = False) -> bool:
+        """
+        Re-apply changed templates to previously generated files.
+        Files whose template is unchanged are skipped without touching the disk, and files edited since they
+        were generated are left alone. With dry_run, print a diff of the changes instead of writing them.
+        """
+        from feature import inject_imports
+        from generated_manifest import content_hash
+
+        if not self.sink.on_disk:
+            self.reporter.error("Error: update only works on files generated on disk")
+            return False
+
+        manifest = self.generated_manifest
+        # Pick up the files recorded by other processes since the manifest was loaded (e.g. by a daemon)
+        manifest.refresh()
+        schematics: dict[tuple[str, str, str], list[str]] = {}
+        for key, entry in manifest.entries.items():
+            schematics.setdefault((entry['type'], entry['path'], entry['name']), []).append(key)
+
+        updates = []
+        unchanged = modified = missing = 0
+        for schematic, keys in schematics.items():
+            type, path, name = schematic
+            files = self.plan(type, path, name, verbose=False)
+            if files is None:
+                self.reporter.warning(f"Cannot re-render {type} '{name}': type or name is no longer valid")
+                continue
+            for (file_path, content), (_, template) in zip(files, self.get_templates(type)):
+                key = manifest.key(file_path)
+                if key not in keys:
+                    continue
+                entry = manifest.entries[key]
+                if entry['template_hash'] == template.digest:
+                    unchanged += 1
+                    continue
+                if entry.get('imports'):
+                    # Imports added by a feature are part of the generated output
+                    content = inject_imports(content, entry['imports'])
+                untouched = manifest.is_untouched(key)
+                if untouched is None:
+                    missing += 1
+                elif not untouched:
+                    modified += 1
+                    self.reporter.file('SKIP', key, 'modified since it was generated')
+                elif content_hash(content) == entry['output_hash']:
+                    # The template changed but renders the same output
+                    entry['template_hash'] = template.digest
+                    manifest.touch(key)
+                else:
+                    updates.append((file_path, content, schematic, template.digest, entry.get('imports')))
+
+        if dry_run:
+            import difflib
+
+            diff = []
+            for file_path, content, *_ in updates:
+                key = manifest.key(file_path)
+                old = self.sink.read_text(file_path)
+                diff.extend(difflib.unified_diff(old.splitlines(True), content.splitlines(True),
+                                                 f'a/{key}', f'b/{key}'))
+            self.reporter.raw(''.join(diff))
+        elif updates:
+            written = self.create_files([(file_path, content) for file_path, content, *_ in updates],
+                                        overwrite=True)
+            if written is None:
+                return False
+            for file_path, content, schematic, template_hash, imports in updates:
+                manifest.record(file_path, schematic, template_hash, content_hash(content), imports)
+                self.reporter.file('UPDATE', manifest.key(file_path))
+
+        if not dry_run:
+            manifest.save()
+
+        action = 'would update' if dry_run else 'updated'
+        self.reporter.success(f"Update complete: {len(updates)} {action}, {unchanged} unchanged, "
+                              f"{modified} modified by hand, {missing} missing", summary=True)
+        self.reporter.summary(updated=len(updates), dry_run=dry_run, unchanged=unchanged, modified=modified,
+                              missing=missing)
+        return True
+
+    @property
+    def barrel_index(self):
+        """Export index of the barrel files, kept for the lifetime of the generator."""
+        if self._barrel_index is None:
+            from barrels import BarrelIndex
+
+            self._barrel_index = BarrelIndex(self.sink)
+        return self._barrel_index
+
+    def find_barrel(self, directory: Path, index: CollisionIndex) -> Path:
+        """
+        Return the nearest index.ts at or above directory (up to src), or a new one in directory itself.
+        Barrels queued earlier in the same run count as existing, so a batch resolves them like separate runs.
+        """
+        from barrels import BARREL_NAMES
+
+        current = directory
+        while True:
+            for barrel_name in BARREL_NAMES:
+                if index.exists(current / barrel_name) or self.barrel_index.is_pending(current / barrel_name):
+                    return current / barrel_name
+            if current == self.src_path or current == current.parent:
+                return directory / BARREL_NAMES[0]
+            current = current.parent
+
+    def queue_barrel_export(self, type: str, path: str, name: str, files: list[tuple[Path, str]],
+                            index: CollisionIndex) -> None:
+        """Queue the export of a schematic's main file in its nearest barrel."""
+        from barrels import export_line
+
+        formatted_name, _, camel_name = self.format_name(name, type)
+        main_file = files[0][0]
+        extension = self.get_templates(type)[0][0]
+        schematic_dir = self.src_path / path if path else self.src_path
+        barrel_path = self.find_barrel(schematic_dir, index)
+        self.barrel_index.add(barrel_path, export_line(type, formatted_name, camel_name, barrel_path,
+                                                       main_file, extension))
+
+    def write_barrels(self) -> list[Path] | None:
+        """Write every barrel with queued exports once. Returns the updated barrels, or None on failure."""
+        barrel_files = self.barrel_index.pending_files()
+        if not barrel_files:
+            return []
+        written = self.create_files(barrel_files, overwrite=True)
+        if written is None:
+            self.barrel_index.discard_pending()
+            return None
+        self.barrel_index.mark_written(barrel_files)
+        return written
+
+
+def split_path_name(path_name: str) -> tuple[str, str]:
+    """Split 'components/ui/Button' into its path ('components/ui') and name ('Button')."""
+    path_parts = path_name.split('/')
+    name = path_parts[-1]
+    path = '/'.join(path_parts[:-1]) if len(path_parts) > 1 else ''
+    return path, name
+
+
+def read_structured_file(source: str):
+    """Read a JSON or YAML document from a file, or from stdin when source is '-'."""
+    if source == '-':
+        text = sys.stdin.read()
+    else:
+        text = Path(source).read_text()
+
+    if source.endswith(('.yaml', '.yml')):
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError("PyYAML is required to read YAML files (pip install pyyaml)")
+        return yaml.safe_load(text)
+
+    import json
+    return json.loads(text)
+
+
+def load_manifest(source: str) -> list[tuple[str, str]]:
+    """
+    Load a batch manifest from a JSON or YAML file, or from stdin when source is '-'.
+
+    The manifest is a list of schematics (or a mapping with a 'schematics' list). Each schematic is either
+    a mapping like {"type": "c", "path_name": "components/ui/Button"} or a string like "c components/ui/Button".
+    """
+    data = read_structured_file(source)
+
+    if isinstance(data, dict):
+        data = data.get('schematics', [])
+
+    entries = []
+    for item in data or []:
+        if isinstance(item, str):
+            type, path_name = item.split(maxsplit=1)
+        elif isinstance(item, dict):
+            type = item['type']
+            path_name = item.get('path_name') or item['name']
+            if item.get('path'):
+                path_name = item['path'].rstrip('/') + '/' + path_name.split('/')[-1]
+        else:
+            type, path_name = item
+        entries.append((type, path_name))
+    return entries
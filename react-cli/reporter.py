@@ -0,0 +1,154 @@
+"""
+# SPDX-License-Identifier: MIT
+# © 2025 Christ Bouka <christbouka14@yahoo.fr>
+#
+# Signed-off-by: Christ Bouka <christbouka14@yahoo.fr>
+
+Output reporter of the React CLI Generator.
+
+Messages are buffered and written with a single write per flush (once per generation or batch) instead of one
+print per line. Modes:
+
+    text      the usual colored output (default)
+    quiet     errors and the summary line of each run only
+    json      one JSON document per flush with every message, written file and summary field
+    progress  like text, without the per-file lines, plus a progress bar on stderr while files are written
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+from colors import Colors
+
+MODES = ('text', 'quiet', 'json', 'progress')
+
+LEVEL_STYLES = {
+    'error': ('RED', '✗ '),
+    'warning': ('YELLOW', '⚠ '),
+    'info': ('BLUE', 'ℹ '),
+    'success': ('GREEN', '✓ '),
+}
+ACTION_COLORS = {'CREATE': 'GREEN', 'UPDATE': 'BLUE', 'SKIP': 'YELLOW'}
+
+
+def use_colors(stream) -> bool:
+    """Colors are only used on a terminal, and never when NO_COLOR is set."""
+    return 'NO_COLOR' not in os.environ and hasattr(stream, 'isatty') and stream.isatty()
+
+
+class Reporter:
+    def __init__(self, mode: str = 'text', stream=None, cwd: str | None = None, color: bool | None = None):
+        self.mode = mode
+        self.stream = stream or sys.stdout
+        # Each reporter has its own palette, so that reporters of concurrent daemon requests can differ. By
+        # default colors follow the stream: a StringIO or a pipe gets no escape codes.
+        if color is None:
+            color = use_colors(self.stream)
+        self._palette = {name: code if color else '' for name, code in Colors.CODES.items()}
+        self._lines: list[str] = []
+        self._messages: list[dict] = []
+        self._files: list[dict] = []
+        self._summary: dict = {}
+        self._progress_percent = -1
+        # Computed once instead of calling Path.cwd() for every reported file
+        self._cwd_prefix = os.path.join(cwd or os.getcwd(), '')
+
+    def display_path(self, path) -> str:
+        """Path relative to the current directory when it is below it, with forward slashes."""
+        path = os.fspath(path)
+        if path.startswith(self._cwd_prefix):
+            path = path[len(self._cwd_prefix):]
+        return path.replace(os.sep, '/')
+
+    def style(self, name: str) -> str:
+        """ANSI code of a Colors attribute (GREEN, BOLD, RESET...), or '' when colors are off."""
+        return self._palette[name]
+
+    @property
+    def lists_files(self) -> bool:
+        """Whether file actions are printed one per line (text mode)."""
+        return self.mode == 'text'
+
+    def _message(self, level: str, text: str, blank_before: bool = False, summary: bool = False) -> None:
+        if self.mode == 'json':
+            self._messages.append({'level': level, 'message': text})
+            return
+        if self.mode == 'quiet' and level != 'error' and not summary:
+            return
+        color, icon = LEVEL_STYLES[level]
+        if blank_before:
+            self._lines.append('')
+        self._lines.append(f"{self.style(color)}{icon}{text}{self.style('RESET')}")
+
+    def error(self, text: str) -> None:
+        self._message('error', text)
+
+    def warning(self, text: str, summary: bool = False) -> None:
+        self._message('warning', text, summary=summary)
+
+    def info(self, text: str) -> None:
+        self._message('info', text)
+
+    def success(self, text: str, blank_before: bool = False, summary: bool = False) -> None:
+        """A success message; summary marks the closing line of a run, which quiet mode keeps."""
+        self._message('success', text, blank_before, summary)
+
+    def file(self, action: str, path, reason: str = '') -> None:
+        """Report a file action (CREATE, UPDATE, SKIP). Only text mode lists files one per line."""
+        if self.mode == 'json':
+            entry = {'action': action, 'path': self.display_path(path)}
+            if reason:
+                entry['reason'] = reason
+            self._files.append(entry)
+        elif self.mode == 'text':
+            color = self.style(ACTION_COLORS.get(action, 'GREEN'))
+            suffix = f" ({reason})" if reason else ''
+            self._lines.append(f"  {color}{action}{self.style('RESET')} {self.display_path(path)}{suffix}")
+
+    def raw(self, text: str) -> None:
+        """Preformatted text such as a diff: kept as is in text and progress modes, a message in json mode."""
+        if not text:
+            return
+        if self.mode == 'json':
+            self._messages.append({'level': 'raw', 'message': text})
+        elif self.mode != 'quiet':
+            self._lines.append(text.rstrip('\n'))
+
+    def blank(self) -> None:
+        if self.mode == 'text':
+            self._lines.append('')
+
+    def summary(self, **fields) -> None:
+        """Machine-readable counters of the run, only written in json mode."""
+        self._summary.update(fields)
+
+    def progress(self, done: int, total: int) -> None:
+        """Redraw the progress bar (progress mode only) when the percentage changes."""
+        if self.mode != 'progress' or not total:
+            return
+        percent = done * 100 // total
+        if percent == self._progress_percent:
+            return
+        self._progress_percent = percent
+        filled = percent // 5
+        end = '\n' if done >= total else ''
+        sys.stderr.write(f"\r[{'#' * filled}{'.' * (20 - filled)}] {percent:3d}% {done}/{total} files{end}")
+        sys.stderr.flush()
+
+    def flush(self) -> None:
+        """Write everything buffered since the last flush in a single write."""
+        if self.mode == 'json':
+            if self._messages or self._files or self._summary:
+                document = {'messages': self._messages, 'files': self._files, **self._summary}
+                self.stream.write(json.dumps(document) + '\n')
+        elif self._lines:
+            self.stream.write('\n'.join(self._lines) + '\n')
+        self.stream.flush()
+        self._lines = []
+        self._messages = []
+        self._files = []
+        self._summary = {}
+        self._progress_percent = -1
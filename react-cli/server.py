@@ -0,0 +1,180 @@
+"""
+# SPDX-License-Identifier: MIT
+# © 2025 Christ Bouka <christbouka14@yahoo.fr>
+#
+# Signed-off-by: Christ Bouka <christbouka14@yahoo.fr>
+
+Persistent React CLI Generator daemon.
+
+Keeps warm generators (compiled templates, name caches) alive and answers JSON requests over a Unix domain
+socket, one JSON object per line:
+
+    {"action": "generate", "cwd": "/project", "type": "c", "path_name": "components/ui/Button", "path": null}
+    {"action": "batch", "cwd": "/project", "entries": [["c", "components/ui/Button"], ["h", "hooks/auth"]]}
+    {"action": "update", "cwd": "/project", "dry_run": true}
+    {"action": "ping"}
+    {"action": "shutdown"}
+
+Requests may also set "output" (text, quiet, json or progress) and "color" (whether to use ANSI colors).
+Each response is one JSON line: {"ok": true|false, "output": "<what the CLI would have printed>"}.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import os
+import socket
+import stat
+import threading
+from pathlib import Path
+
+from colors import Colors
+from generator import ReactCLIGenerator, TYPE_ALIASES, split_path_name
+from reporter import Reporter
+
+
+class GeneratorDaemon:
+    """
+    Requests run in the event loop's default thread pool, so a large batch does not hold up other clients.
+    Requests for the same project are serialized by a per-project lock, since a generator and its caches
+    are not thread-safe; requests for different projects run concurrently.
+    """
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        # src path -> (warm generator, lock held while it runs a request)
+        self._generators: dict[Path, tuple[ReactCLIGenerator, threading.Lock]] = {}
+        self._generators_lock = threading.Lock()
+        self._server = None
+
+    def get_generator(self, cwd: str) -> tuple[ReactCLIGenerator, threading.Lock]:
+        """Return the warm generator of a project and its lock."""
+        src_path = Path(cwd) / 'src'
+        with self._generators_lock:
+            generator = self._generators.get(src_path)
+            if generator is None:
+                generator = (ReactCLIGenerator(src_path), threading.Lock())
+                self._generators[src_path] = generator
+        return generator
+
+    def handle_request(self, request: dict) -> dict:
+        """Run one generation request (in a worker thread) and return the output the CLI would have printed."""
+        action = request.get('action', 'generate')
+        cwd = request.get('cwd') or os.getcwd()
+        output = io.StringIO()
+        # Each request has its own palette: the global Colors switch is shared by concurrent requests
+        reporter = Reporter(request.get('output', 'text'), stream=output, cwd=cwd,
+                            color=bool(request.get('color', False)))
+        try:
+            generator, lock = self.get_generator(cwd)
+            with lock:
+                generator.reporter = reporter
+                generator.reload_templates()
+                if not generator.src_path.exists():
+                    reporter.warning("Warning: 'src' directory not found. Creating it...")
+                    generator.src_path.mkdir(exist_ok=True)
+
+                on_existing = request.get('on_existing', 'error')
+                if action == 'batch':
+                    ok = generator.generate_batch([tuple(entry) for entry in request['entries']],
+                                                  workers=request.get('workers'), on_existing=on_existing,
+                                                  barrel=request.get('barrel', False))
+                elif action == 'update':
+                    ok = generator.update(dry_run=request.get('dry_run', False))
+                elif action == 'generate':
+                    type = TYPE_ALIASES.get(request['type'], request['type'])
+                    path, name = split_path_name(request['path_name'])
+                    if request.get('path'):
+                        path = request['path']
+                    ok = generator.generate(type, path, name, on_existing=on_existing,
+                                            barrel=request.get('barrel', False))
+                else:
+                    reporter.error(f"Error: Unknown action '{action}'")
+                    ok = False
+        except Exception as e:
+            reporter.error(f"Unexpected error: {str(e)}")
+            ok = False
+        reporter.flush()
+        return {'ok': ok, 'output': output.getvalue()}
+
+    async def respond(self, request) -> dict:
+        """Answer ping and shutdown on the event loop, and run everything else in a worker thread."""
+        if not isinstance(request, dict):
+            raise TypeError(f"expected a JSON object, got {type(request).__name__}")
+        action = request.get('action', 'generate')
+        if action == 'ping':
+            return {'ok': True, 'output': ''}
+        if action == 'shutdown':
+            self._server.close()
+            return {'ok': True, 'output': ''}
+        return await asyncio.get_running_loop().run_in_executor(None, self.handle_request, request)
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = await self.respond(json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    response = {'ok': False, 'output': f"✗ Invalid request: {str(e)}\n"}
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except (asyncio.CancelledError, ConnectionError):
+            # Client went away, or the daemon is shutting down
+            pass
+        finally:
+            writer.close()
+
+    def _claim_socket_path(self) -> bool:
+        """
+        Remove a socket file left behind by a crashed daemon, which would make the bind fail.
+        Returns False if another daemon still answers on it, or if the path is not a socket.
+        """
+        try:
+            mode = os.lstat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return True
+        if not stat.S_ISSOCK(mode):
+            return False
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.settimeout(1.0)
+            try:
+                probe.connect(self.socket_path)
+            except ConnectionRefusedError:
+                os.unlink(self.socket_path)
+                return True
+            except OSError:
+                # Busy or unreachable: leave it alone rather than stealing a live daemon's socket
+                return False
+        return False
+
+    async def serve(self) -> bool:
+        if not self._claim_socket_path():
+            print(f"{Colors.RED}✗ {self.socket_path} is in use by another daemon (or is not a socket){Colors.RESET}")
+            return False
+        # Created with 0600 permissions right away: a chmod after the bind would leave a window in which
+        # other users could connect
+        umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(self.handle_client, path=self.socket_path)
+        finally:
+            os.umask(umask)
+        print(f"{Colors.GREEN}✓ React CLI daemon listening on {self.socket_path}{Colors.RESET}")
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        return True
+
+
+def serve(socket_path: str) -> bool:
+    """Run the daemon until it is interrupted or receives a shutdown request. Returns False if it cannot start."""
+    return asyncio.run(GeneratorDaemon(socket_path).serve())
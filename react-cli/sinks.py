@@ -0,0 +1,348 @@
+"""
+# SPDX-License-Identifier: MIT
+# © 2025 Christ Bouka <christbouka14@yahoo.fr>
+#
+# Signed-off-by: Christ Bouka <christbouka14@yahoo.fr>
+
+Output sinks of the React CLI Generator: where generated files end up.
+
+    DiskSink      the project tree, written atomically through WriteTransaction (default)
+    MemorySink    an in-memory file tree, for tests and tools that inspect the output
+    ArchiveSink   a tar or zip archive streamed as files are committed, for CI artifacts
+
+Every sink provides the same small interface used by ReactCLIGenerator:
+
+    names(directory)        entry names of a directory, or None if it does not exist
+    transaction(overwrite)  a transaction with ensure_dir(), stage(), commit() and rollback()
+    signature(path)         a value that changes whenever the file changes, or None if it does not exist
+    read_text(path)         the content of a file
+    on_disk                 whether files land in the real project (the generated-files manifest and update
+                            only make sense then)
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import threading
+import time
+from itertools import count
+from pathlib import Path
+
+_temp_ids = count()
+
+
+def _move_no_clobber(source: str, target: Path) -> None:
+    """
+    Move source to target, failing with FileExistsError if target exists. Checking for the target and then
+    renaming would let a concurrent writer slip in between: link() fails atomically with EEXIST instead.
+    """
+    try:
+        os.link(source, target)
+    except FileExistsError:
+        raise FileExistsError(errno.EEXIST, 'File already exists', str(target)) from None
+    except OSError as e:
+        # Filesystems without hard links: fall back to a check followed by a rename
+        if e.errno not in (errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EXDEV, errno.EMLINK):
+            raise
+        if os.path.lexists(target):
+            raise FileExistsError(errno.EEXIST, 'File already exists', str(target)) from None
+        os.replace(source, target)
+        return
+    os.unlink(source)
+
+
+class WriteTransaction:
+    """
+    Write several files atomically. Files are staged as temporary files next to their targets, synced to disk
+    in bulk and moved into place on commit (with os.replace, or os.link when existing files must be kept).
+    If anything fails before the commit completes, every replaced file, temporary file and created directory is
+    rolled back.
+    """
+
+    def __init__(self, overwrite: bool = False):
+        self.overwrite = overwrite
+        self._staged: list[tuple[Path, str]] = []
+        self._created_dirs: list[Path] = []
+        self._known_dirs = set()
+        self._committed = False
+
+    def __enter__(self) -> WriteTransaction:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if not self._committed:
+            self.rollback()
+
+    def ensure_dir(self, directory: Path, exists: bool | None = None) -> None:
+        """
+        Create a directory (once per transaction) and remember the levels created for the rollback.
+        Pass exists=True when the caller already knows the directory exists to skip the filesystem checks.
+        """
+        if directory in self._known_dirs:
+            return
+        if exists:
+            self._known_dirs.add(directory)
+            return
+        missing = []
+        parent = directory
+        while not parent.exists():
+            missing.append(parent)
+            parent = parent.parent
+        directory.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.extend(reversed(missing))
+        self._known_dirs.add(directory)
+
+    def stage(self, file_path: Path, content: str) -> None:
+        """Write content to a temporary file in the target directory."""
+        self.ensure_dir(file_path.parent)
+        # Unique per process and per staged file; O_EXCL guarantees no other writer owns the name
+        temp_path = os.path.join(file_path.parent, f'.{file_path.name}.{os.getpid()}.{next(_temp_ids)}.tmp')
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        self._staged.append((file_path, temp_path))
+        # UTF-8 without newline translation, whatever the locale: read_text, the hashes and the manifest
+        # assume the exact rendered content
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+
+    def commit(self) -> list[Path]:
+        """Sync every staged file, then move them all into place. Returns the written paths."""
+        for _, temp_path in self._staged:
+            fd = os.open(temp_path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+        replaced: list[tuple[Path, str | None]] = []
+        try:
+            for file_path, temp_path in self._staged:
+                backup_path = None
+                if not self.overwrite:
+                    _move_no_clobber(temp_path, file_path)
+                else:
+                    if os.path.lexists(file_path):
+                        backup_path = temp_path + '.bak'
+                        os.replace(file_path, backup_path)
+                    os.replace(temp_path, file_path)
+                replaced.append((file_path, backup_path))
+        except BaseException:
+            for file_path, backup_path in reversed(replaced):
+                if backup_path:
+                    os.replace(backup_path, file_path)
+                else:
+                    os.unlink(file_path)
+            raise
+
+        self._committed = True
+        for _, backup_path in replaced:
+            if backup_path:
+                os.unlink(backup_path)
+        return [file_path for file_path, _ in self._staged]
+
+    def rollback(self) -> None:
+        """Remove staged temporary files and the directories created by this transaction."""
+        for _, temp_path in self._staged:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+        for directory in reversed(self._created_dirs):
+            try:
+                directory.rmdir()
+            except OSError:
+                pass
+        self._staged.clear()
+
+
+class DiskSink:
+    """Writes into the project tree."""
+
+    on_disk = True
+
+    def names(self, directory: Path) -> frozenset | None:
+        try:
+            with os.scandir(directory) as entries:
+                return frozenset(entry.name for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def transaction(self, overwrite: bool = False) -> WriteTransaction:
+        return WriteTransaction(overwrite=overwrite)
+
+    def signature(self, path: Path) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def read_text(self, path: Path) -> str:
+        with open(path, encoding='utf-8', newline='') as f:
+            return f.read()
+
+
+class _BufferedTransaction:
+    """Collects staged files in memory and hands them to the sink in one piece on commit."""
+
+    def __init__(self, sink: MemorySink | ArchiveSink, overwrite: bool):
+        self.sink = sink
+        self.overwrite = overwrite
+        self._staged: list[tuple[Path, str]] = []
+        self._dirs: list[Path] = []
+
+    def __enter__(self) -> _BufferedTransaction:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.rollback()
+
+    def ensure_dir(self, directory: Path, exists: bool | None = None) -> None:
+        self._dirs.append(directory)
+
+    def stage(self, file_path: Path, content: str) -> None:
+        # list.append is atomic, so files can be staged from a thread pool
+        self._staged.append((file_path, content))
+
+    def commit(self) -> list[Path]:
+        staged, self._staged = self._staged, []
+        return self.sink._commit(staged, self._dirs, self.overwrite)
+
+    def rollback(self) -> None:
+        self._staged = []
+
+
+class _TreeSink:
+    """Directory bookkeeping shared by the sinks that do not write into the project tree."""
+
+    on_disk = False
+
+    def __init__(self):
+        self._tree: dict[Path, set[str]] = {}
+        # path -> (write count, size), see signature()
+        self._versions: dict[Path, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def _add_dir(self, directory: Path) -> None:
+        while directory not in self._tree:
+            self._tree[directory] = set()
+            if directory.parent == directory:
+                break
+            self._tree.setdefault(directory.parent, set()).add(directory.name)
+            directory = directory.parent
+
+    def _add_file(self, file_path: Path, content: str) -> None:
+        self._add_dir(file_path.parent)
+        self._tree[file_path.parent].add(file_path.name)
+        version = self._versions.get(file_path, (0, 0))[0] + 1
+        self._versions[file_path] = (version, len(content))
+
+    def _commit(self, staged: list[tuple[Path, str]], dirs: list[Path], overwrite: bool) -> list[Path]:
+        with self._lock:
+            if not overwrite:
+                for file_path, _ in staged:
+                    if file_path in self._versions:
+                        raise FileExistsError(errno.EEXIST, 'File already exists', str(file_path))
+            for directory in dirs:
+                self._add_dir(directory)
+            for file_path, content in staged:
+                self._write(file_path, content)
+                self._add_file(file_path, content)
+        return [file_path for file_path, _ in staged]
+
+    def _write(self, file_path: Path, content: str) -> None:
+        raise NotImplementedError
+
+    def names(self, directory: Path) -> frozenset | None:
+        names = self._tree.get(Path(directory))
+        return frozenset(names) if names is not None else None
+
+    def transaction(self, overwrite: bool = False) -> _BufferedTransaction:
+        return _BufferedTransaction(self, overwrite)
+
+    def signature(self, path: Path) -> tuple[int, int] | None:
+        return self._versions.get(Path(path))
+
+
+class MemorySink(_TreeSink):
+    """Keeps generated files in a dict of path -> content."""
+
+    def __init__(self):
+        super().__init__()
+        self.files: dict[Path, str] = {}
+
+    def _write(self, file_path: Path, content: str) -> None:
+        self.files[file_path] = content
+
+    def read_text(self, path: Path) -> str:
+        try:
+            return self.files[Path(path)]
+        except KeyError:
+            raise FileNotFoundError(errno.ENOENT, 'No such file', str(path)) from None
+
+
+class ArchiveSink(_TreeSink):
+    """
+    Streams generated files into a tar (.tar, .tar.gz, .tgz, .tar.bz2, .tar.xz) or zip archive.
+
+    Member names are relative to root (the current directory by default), so the archive extracts to the
+    same layout the disk sink would have written. Contents are not kept after they are written: a file that
+    is rewritten (e.g. a barrel updated by a second batch) is added again, and the last copy wins on
+    extraction. Call close() (or use the sink as a context manager) to finish the archive.
+    """
+
+    def __init__(self, target: str | Path, root: str | Path | None = None):
+        super().__init__()
+        self.target = str(target)
+        self.root = os.path.abspath(root or os.getcwd())
+        if self.target.endswith('.zip'):
+            import zipfile
+
+            self._zip = zipfile.ZipFile(self.target, 'w', compression=zipfile.ZIP_DEFLATED)
+            self._tar = None
+        else:
+            import tarfile
+
+            compressions = (('.gz', 'gz'), ('.tgz', 'gz'), ('.bz2', 'bz2'), ('.xz', 'xz'))
+            compression = next((suffix for extension, suffix in compressions if self.target.endswith(extension)), '')
+            # Stream mode: members are written sequentially and never seeked back to
+            self._tar = tarfile.open(self.target, f'w|{compression}')
+            self._zip = None
+
+    def __enter__(self) -> ArchiveSink:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def member_name(self, file_path: Path) -> str:
+        return os.path.relpath(os.path.abspath(file_path), self.root).replace(os.sep, '/')
+
+    def _write(self, file_path: Path, content: str) -> None:
+        data = content.encode('utf-8')
+        name = self.member_name(file_path)
+        if self._zip is not None:
+            import zipfile
+
+            info = zipfile.ZipInfo(name, time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self._zip.writestr(info, data)
+        else:
+            import io
+            import tarfile
+
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o644
+            info.mtime = int(time.time())
+            self._tar.addfile(info, io.BytesIO(data))
+
+    def read_text(self, path: Path) -> str:
+        raise FileNotFoundError(errno.ENOENT, 'Archive members cannot be read back', str(path))
+
+    def close(self) -> None:
+        archive = self._zip or self._tar
+        if archive is not None:
+            archive.close()
+            self._zip = self._tar = None
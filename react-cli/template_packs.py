@@ -0,0 +1,174 @@
+"""
+# SPDX-License-Identifier: MIT
+# © 2025 Christ Bouka <christbouka14@yahoo.fr>
+#
+# Signed-off-by: Christ Bouka <christbouka14@yahoo.fr>
+
+External template packs for the React CLI Generator.
+
+A project can override or add schematic types with template files:
+
+    .react-cli/templates/<type>/<extension>.tpl      e.g. .react-cli/templates/component/module.scss.tpl
+
+Each file is a template in the TEMPLATES syntax ('{{' and '}}' escapes) and generates
+`<formatted name>.<extension>`. The slots of TEMPLATE_SLOTS are available: {name}, {pascalName},
+{camelName}, {kebabName}, {snakeName} and {constantName}. A template using any other slot, or that does
+not parse, makes its type unavailable with an error naming the file; the other types still work.
+
+The main file of a type (the one barrels export and features add imports to) is the `tsx.tpl`, `ts.tpl`,
+`jsx.tpl` or `js.tpl` file, in that order of preference. Failing that, it is the first code file that is not a
+test, story or types file, and failing that, the first file by name. It is always listed first.
+
+Compiled templates are stored in .react-cli/templates.cache.json, keyed on path, mtime and size, so
+unchanged templates are never re-read or re-parsed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from generator import CompiledTemplate, TEMPLATE_SLOTS
+
+TEMPLATES_DIR = os.path.join('.react-cli', 'templates')
+CACHE_FILE = os.path.join('.react-cli', 'templates.cache.json')
+CACHE_VERSION = 1
+
+# Extensions of a main file, by order of preference
+MAIN_EXTENSIONS = ('tsx', 'ts', 'jsx', 'js')
+# Inner extension parts of files that are never the main file (Button.test.tsx, Button.types.ts...)
+SECONDARY_PARTS = frozenset({'test', 'spec', 'stories', 'types', 'd', 'module'})
+
+
+def main_first(files: list[tuple[str, CompiledTemplate]]) -> list[tuple[str, CompiledTemplate]]:
+    """Move the main file of a type (see the module docstring) to the front of its (extension, template) list."""
+    def rank(extension: str):
+        parts = extension[1:].split('.')
+        if parts[-1] not in MAIN_EXTENSIONS or SECONDARY_PARTS.intersection(parts[:-1]):
+            return None
+        return len(parts), MAIN_EXTENSIONS.index(parts[-1])
+
+    ranked = [(rank(extension), position) for position, (extension, _) in enumerate(files)]
+    candidates = [item for item in ranked if item[0] is not None]
+    main = min(candidates)[1] if candidates else 0
+    return [files[main]] + files[:main] + files[main + 1:]
+
+
+class TemplatePack:
+    """Templates of one project root, compiled once and cached on disk and in memory."""
+
+    def __init__(self, root: str | Path):
+        self.templates_dir = Path(root) / TEMPLATES_DIR
+        self.cache_path = Path(root) / CACHE_FILE
+        # '<type>/<file name>' -> (mtime_ns, size, compiled template)
+        self._compiled: dict[str, tuple[int, int, CompiledTemplate]] | None = None
+        # type -> why its templates cannot be used, filled by load()
+        self.errors: dict[str, str] = {}
+
+    def display_path(self, key: str) -> str:
+        return '/'.join((TEMPLATES_DIR.replace(os.sep, '/'), key))
+
+    def _read_cache(self) -> dict[str, tuple[int, int, CompiledTemplate]]:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        # A cache of any other shape (edited by hand, written by another version) is a miss and gets rebuilt
+        try:
+            if data.get('version') != CACHE_VERSION:
+                return {}
+            cache = {}
+            for path, entry in data['entries'].items():
+                parts, slots = entry['parts'], [tuple(slot) for slot in entry['slots']]
+                valid = (isinstance(path, str) and isinstance(entry['mtime_ns'], int)
+                         and isinstance(entry['size'], int) and isinstance(parts, list)
+                         and all(isinstance(part, str) for part in parts)
+                         and all(isinstance(index, int) and 0 <= index < len(parts) and name in TEMPLATE_SLOTS
+                                 for index, name in slots))
+                if not valid:
+                    return {}
+                cache[path] = (entry['mtime_ns'], entry['size'], CompiledTemplate.from_parts(parts, slots))
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return {}
+        return cache
+
+    def _write_cache(self) -> None:
+        data = {
+            'version': CACHE_VERSION,
+            'entries': {
+                path: {'mtime_ns': mtime_ns, 'size': size, 'parts': template.parts, 'slots': template.slots}
+                for path, (mtime_ns, size, template) in self._compiled.items()
+            },
+        }
+        temp_path = f'{self.cache_path}.{os.getpid()}.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            # The cache is only an optimization, a read-only checkout must still work
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+    def load(self) -> dict[str, list[tuple[str, CompiledTemplate]]]:
+        """
+        Return the (extension, compiled template) pairs of every valid type in the pack, main file first.
+        Types with an invalid template are left out and their error is stored in self.errors.
+        Directories are listed with os.scandir; only templates whose mtime or size changed are read and compiled.
+        """
+        self.errors = {}
+        try:
+            type_dirs = sorted((entry for entry in os.scandir(self.templates_dir) if entry.is_dir()),
+                               key=lambda entry: entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+
+        if self._compiled is None:
+            self._compiled = self._read_cache()
+
+        pack = {}
+        seen = set()
+        changed = False
+        for type_dir in type_dirs:
+            files = []
+            with os.scandir(type_dir.path) as entries:
+                template_files = sorted((entry for entry in entries
+                                         if entry.name.endswith('.tpl') and entry.is_file()),
+                                        key=lambda entry: entry.name)
+            for entry in template_files:
+                stat = entry.stat()
+                key = f'{type_dir.name}/{entry.name}'
+                seen.add(key)
+                cached = self._compiled.get(key)
+                if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    template = cached[2]
+                else:
+                    try:
+                        with open(entry.path, encoding='utf-8', newline='') as f:
+                            template = CompiledTemplate(f.read())
+                    except ValueError as e:
+                        self.errors.setdefault(type_dir.name, f"Invalid template {self.display_path(key)}: {e}")
+                        continue
+                    self._compiled[key] = (stat.st_mtime_ns, stat.st_size, template)
+                    changed = True
+                unknown = [slot for _, slot in template.slots if slot not in TEMPLATE_SLOTS]
+                if unknown:
+                    available = ', '.join('{' + slot + '}' for slot in TEMPLATE_SLOTS)
+                    self.errors.setdefault(type_dir.name,
+                                           f"Invalid template {self.display_path(key)}: "
+                                           f"unknown slot '{{{unknown[0]}}}' (available: {available})")
+                files.append(('.' + entry.name[:-len('.tpl')], template))
+            if files and type_dir.name not in self.errors:
+                pack[type_dir.name] = main_first(files)
+
+        # Forget templates that were deleted since the cache was written
+        for key in [key for key in self._compiled if key not in seen]:
+            del self._compiled[key]
+            changed = True
+
+        if changed:
+            self._write_cache()
+        return pack
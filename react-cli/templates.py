@@ -0,0 +1,325 @@
+"""
+# SPDX-License-Identifier: MIT
+# © 2025 Christ Bouka <christbouka14@yahoo.fr>
+#
+# Signed-off-by: Christ Bouka <christbouka14@yahoo.fr>
+
+Templates used by the React CLI Generator, one entry per schematic type.
+Kept in their own module so they are only loaded once a type has been chosen.
+"""
+
+
+# Template configurations
+TEMPLATES = {
+    'component': {
+        'files': [
+            {
+                'extension': '.tsx',
+                'template': '''import React from 'react';
+import styles from './{name}.module.scss';
+import {{ {name}Props }} from './{name}.types';
+
+const {name}: React.FC<{name}Props> = ({{}}) => {{
+  return (
+    <div className={{styles.container}}>
+      <h1>{name} Component</h1>
+    </div>
+  );
+}};
+
+export default {name};
+'''
+            },
+            {
+                'extension': '.module.scss',
+                'template': '''.container {{
+  // Add your styles here
+}}
+'''
+            },
+            {
+                'extension': '.test.tsx',
+                'template': '''import React from 'react';
+import {{ render, screen }} from '@testing-library/react';
+import {name} from './{name}';
+
+describe('{name}', () => {{
+  it('renders without crashing', () => {{
+    render(<{name} />);
+    const element = screen.getByText('{name} Component');
+    expect(element).toBeInTheDocument();
+  }});
+}});
+'''
+            },
+            {
+                'extension': '.types.ts',
+                'template': '''export interface {name}Props {{
+  // Define your props here
+}}
+'''
+            }
+        ]
+    },
+    'service': {
+        'files': [
+            {
+                'extension': '.ts',
+                'template': '''export class {name} {{
+  private static instance: {name};
+
+  private constructor() {{
+    // Private constructor for singleton pattern
+  }}
+
+  public static getInstance(): {name} {{
+    if (!{name}.instance) {{
+      {name}.instance = new {name}();
+    }}
+    return {name}.instance;
+  }}
+
+  // Add your service methods here
+  public async getData(): Promise<any> {{
+    // Implement your logic
+    return {{}};
+  }}
+}}
+
+export default {name}.getInstance();
+'''
+            },
+            {
+                'extension': '.test.ts',
+                'template': '''import singleton from './{name}';
+
+describe('{name}', () => {{
+  it('should be a singleton', () => {{
+    const instance1 = singleton;
+    const instance2 = singleton;
+    expect(instance1).toBe(instance2);
+  }});
+
+  it('should have getData method', () => {{
+    const instance = singleton;
+    expect(instance.getData).toBeDefined();
+  }});
+}});
+'''
+            }
+        ]
+    },
+    'hook': {
+        'files': [
+            {
+                'extension': '.ts',
+                'template': '''import {{ useState, useEffect }} from 'react';
+
+export const {name} = () => {{
+  const [data, setData] = useState<any>(null);
+  const [loading, setLoading] = useState<boolean>(false);
+  const [error, setError] = useState<Error | null>(null);
+
+  useEffect(() => {{
+    // Add your hook logic here
+  }}, []);
+
+  return {{ data, loading, error }};
+}};
+
+export default {name};
+'''
+            },
+            {
+                'extension': '.test.ts',
+                'template': '''import {{ renderHook }} from '@testing-library/react-hooks';
+import {{ {name} }} from './{name}';
+
+describe('{name}', () => {{
+  it('should return initial state', () => {{
+    const {{ result }} = renderHook(() => {name}());
+
+    expect(result.current.data).toBeNull();
+    expect(result.current.loading).toBe(false);
+    expect(result.current.error).toBeNull();
+  }});
+}});
+'''
+            }
+        ]
+    },
+    'redux': {
+        'files': [
+            {
+                'extension': '.ts',
+                'template': '''import {{ createSlice, PayloadAction }} from '@reduxjs/toolkit';
+// import type {{ RootState }} from '../store'; // Adjust path to your root state
+
+// Define a type for the slice state
+export interface {pascalName}State {{
+  value: number;
+  status: 'idle' | 'loading' | 'failed';
+}}
+
+// Define the initial state using that type
+const initialState: {pascalName}State = {{
+  value: 0,
+  status: 'idle',
+}};
+
+export const {name} = createSlice({{
+  name: '{camelName}',
+  initialState,
+  // The `reducers` field lets us define reducers and generate associated actions
+  reducers: {{
+    increment: (state) => {{
+      state.value += 1;
+    }},
+    decrement: (state) => {{
+      state.value -= 1;
+    }},
+    // Use the PayloadAction type to declare the contents of `action.payload`
+    incrementByAmount: (state, action: PayloadAction<number>) => {{
+      state.value += action.payload;
+    }},
+  }},
+}});
+
+export const {{ increment, decrement, incrementByAmount }} = {name}.actions;
+
+// The function below is called a selector and allows us to select a value from
+// the state. Selectors can also be defined inline where they're used instead of
+// in the slice file. For example: `useSelector((state: RootState) => state.{camelName}.value)`
+// export const selectCount = (state: RootState) => state.{camelName}.value;
+
+export default {name}.reducer;
+'''
+            },
+            {
+                'extension': '.test.ts',
+                'template': '''import reducer, {{ {pascalName}State, increment, decrement }} from './{name}';
+
+describe('{name} reducer', () => {{
+  const initialState: {pascalName}State = {{
+    value: 3,
+    status: 'idle',
+  }};
+
+  it('should handle initial state', () => {{
+    expect(reducer(undefined, {{ type: 'unknown' }})).toEqual({{
+        value: 0,
+        status: 'idle',
+    }});
+  }});
+
+  it('should handle increment', () => {{
+    const actual = reducer(initialState, increment());
+    expect(actual.value).toEqual(4);
+  }});
+
+  it('should handle decrement', () => {{
+    const actual = reducer(initialState, decrement());
+    expect(actual.value).toEqual(2);
+  }});
+}});
+'''
+            }
+        ]
+    },
+    'context': {
+        'files': [
+            {
+                'extension': '.tsx',
+                'template': '''import React, {{ createContext, useContext, useState, useMemo }} from 'react';
+import {{ {name}Props, {name}Type }} from './{name}.types';
+
+const {name}Context = createContext<{name}Type | undefined>(undefined);
+
+export const {name}Provider: React.FC<{name}Props> = ({{ children }}) => {{
+  const [value, setValue] = useState<string>('Default Value'); // Example state
+
+  const contextValue = useMemo(() => ({{
+    value,
+    setValue,
+  }}), [value]);
+
+  return (
+    <{name}Context.Provider value={{contextValue}}>
+      {{children}}
+    </{name}Context.Provider>
+  );
+}};
+
+export const use{pascalName} = (): {name}Type => {{
+  const context = useContext({name}Context);
+  if (context === undefined) {{
+    throw new Error(`use{pascalName} must be used within a {name}Provider`);
+  }}
+  return context;
+}};
+'''
+            },
+            {
+                'extension': '.types.ts',
+                'template': '''import React from 'react';
+
+export interface {name}Props {{
+  children: React.ReactNode;
+}}
+
+export interface {name}Type {{
+  value: string;
+  setValue: React.Dispatch<React.SetStateAction<string>>;
+}}
+'''
+            },
+            {
+                'extension': '.test.tsx',
+                'template': '''import React from 'react';
+import {{ render, screen, act }} from '@testing-library/react';
+import userEvent from '@testing-library/user-event';
+import {{ {name}Provider, use{pascalName} }} from './{name}';
+
+const TestComponent: React.FC = () => {{
+  const {{ value, setValue }} = use{pascalName}();
+  return (
+    <div>
+      <span>{{value}}</span>
+      <button onClick={{() => setValue('New Value')}}>Change</button>
+    </div>
+  );
+}};
+
+describe('{name}', () => {{
+  it('provides the default value and allows updates', async () => {{
+    render(
+      <{name}Provider>
+        <TestComponent />
+      </{name}Provider>
+    );
+
+    // Check initial value
+    expect(screen.getByText('Default Value')).toBeInTheDocument();
+
+    // Update value
+    const button = screen.getByRole('button', {{ name: /change/i }});
+    await userEvent.click(button);
+
+    // Check updated value
+    expect(screen.getByText('New Value')).toBeInTheDocument();
+  }});
+
+  it('throws an error when used outside of a provider', () => {{
+    // Suppress console.error for this expected error
+    jest.spyOn(console, 'error').mockImplementation(() => {{}});
+
+    expect(() => render(<TestComponent />)).toThrow('use{pascalName} must be used within a {name}Provider');
+
+    jest.restoreAllMocks();
+  }});
+}});
+'''
+            }
+        ]
+    }
+}
@@ -0,0 +1,181 @@
+"""
+# SPDX-License-Identifier: MIT
+# © 2025 Christ Bouka <christbouka14@yahoo.fr>
+#
+# Signed-off-by: Christ Bouka <christbouka14@yahoo.fr>
+
+Watch mode for the React CLI Generator (`cli.py react watch`).
+
+New empty folders under src/ whose name is a valid component name (e.g. src/components/ui/NewThing/) are
+scaffolded automatically: NewThing becomes a component and NewThingContext a context. Events are read with
+inotify on Linux, with a polling fallback elsewhere. Bursts of events are debounced and coalesced into a single
+batch generation, and the watcher blocks without a timeout while nothing is pending, so it uses no CPU when idle.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from generator import ReactCLIGenerator
+
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def list_directories(root: Path) -> list[Path]:
+    """Return root and every directory below it."""
+    directories = [root]
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                directories.extend(Path(entry.path) for entry in entries
+                                   if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'))
+        except OSError:
+            pass
+    return directories
+
+
+class InotifyWatcher:
+    """Reports new directories with Linux inotify, watching every directory of the tree."""
+
+    def __init__(self, root: Path):
+        import ctypes
+
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._watches: dict[int, Path] = {}
+        self.overflowed = False
+        for directory in list_directories(root):
+            self._add_watch(directory)
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), IN_CREATE | IN_MOVED_TO)
+        if wd >= 0:
+            self._watches[wd] = directory
+
+    def wait(self, timeout: float | None) -> list[Path]:
+        """Block until events arrive (or the timeout expires) and return the directories that were created."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+
+        data = os.read(self._fd, 64 * 1024)
+        created = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                self.overflowed = True
+            elif mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+            elif mask & IN_ISDIR and wd in self._watches:
+                # Folders created inside the new folder before its watch existed are picked up by the walk
+                for directory in list_directories(self._watches[wd] / os.fsdecode(name)):
+                    self._add_watch(directory)
+                    created.append(directory)
+        return created
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Reports new directories by rescanning the tree every `interval` seconds."""
+
+    def __init__(self, root: Path, interval: float = 1.0):
+        self.root = root
+        self.interval = interval
+        self._known = set(list_directories(root))
+
+    def wait(self, timeout: float | None) -> list[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval if deadline is None else min(self.interval, max(deadline - time.monotonic(), 0))
+            time.sleep(delay)
+            directories = list_directories(self.root)
+            created = [directory for directory in directories if directory not in self._known]
+            self._known = set(directories)
+            if created or (deadline is not None and time.monotonic() >= deadline):
+                return created
+
+    def close(self) -> None:
+        pass
+
+
+def create_watcher(root: Path, poll: bool = False, interval: float = 1.0):
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root, interval)
+
+
+def is_empty(directory: Path) -> bool:
+    """Whether a directory has no entries other than hidden files (e.g. .DS_Store)."""
+    try:
+        with os.scandir(directory) as entries:
+            return not any(not entry.name.startswith('.') for entry in entries)
+    except OSError:
+        return False
+
+
+def schematic_for(generator: ReactCLIGenerator, directory: Path) -> tuple[str, str] | None:
+    """Return the (type, path_name) to scaffold in a new folder, or None if its name is not a schematic name."""
+    name = directory.name
+    type = 'context' if name.endswith('Context') else 'component'
+    formatted_name = generator.format_name(name, type)[0]
+    if formatted_name != name or not generator.validate_name(formatted_name, type):
+        return None
+    return type, os.path.relpath(directory, generator.src_path).replace(os.sep, '/')
+
+
+def watch(generator: ReactCLIGenerator, debounce: float = 0.3, poll: bool = False, interval: float = 1.0,
+          barrel: bool = False) -> None:
+    """Scaffold new empty folders under the generator's src directory until interrupted."""
+    watcher = create_watcher(generator.src_path, poll, interval)
+    mode = 'polling' if isinstance(watcher, PollingWatcher) else 'inotify'
+    reporter = generator.reporter
+    reporter.info(f"Watching {generator.src_path} for new folders ({mode}). Press Ctrl+C to stop.")
+    reporter.flush()
+
+    pending: dict[Path, None] = {}
+    try:
+        while True:
+            # Block indefinitely while idle; once something is pending, wait only until the burst is over
+            created = watcher.wait(debounce if pending else None)
+            if getattr(watcher, 'overflowed', False):
+                watcher.overflowed = False
+                reporter.warning("Too many events at once, some folders may have been missed")
+            if created:
+                pending.update(dict.fromkeys(created))
+                continue
+            if not pending:
+                continue
+
+            entries = []
+            for directory in pending:
+                schematic = schematic_for(generator, directory) if is_empty(directory) else None
+                if schematic:
+                    entries.append(schematic)
+            pending.clear()
+            if entries:
+                generator.reload_templates()
+                generator.generate_batch(entries, on_existing='skip', barrel=barrel)
+            reporter.flush()
+    finally:
+        watcher.close()